@@ -1,5 +1,6 @@
 #!/usr/bin/python3
 """Calculate the version based on the git commit count and update pyproject.toml"""
+import re
 import subprocess
 from warnings import warn
 
@@ -8,59 +9,57 @@ branch = "HEAD"
 
 def calculate_version():
     """Calculate the version based on the git commit count since the latest tag"""
-    tags = subprocess.check_output(["git", "tag"]).decode().strip().split("\n")
-
-    # Handle no tags condition
-    if len(tags) == 1 and tags[0] == "":
-        tags = []
-
-    # Check for latest tag and skip if there is no tag
-    latest_tag = None
-    if tags and max(tags).startswith("v"):
-        latest_tag = max(tags)
-
-    if latest_tag:
-        commit_count = int(
-            subprocess.check_output(["git", "rev-list", "--count", f"{latest_tag}..{branch}"])
+    # A single `git describe` reports both the latest tag and the number of commits since it,
+    #  e.g. "v0.1.10-5-g1234abc". Git picks the tag itself, so there is no need to list all
+    #  tags and sort them here. It fails if there is no matching tag at all.
+    try:
+        description = (
+            subprocess.check_output(
+                ["git", "describe", "--tags", "--long", "--match", "v[0-9]*.[0-9]*.[0-9]*", branch],
+                stderr=subprocess.DEVNULL,
+            )
             .decode()
             .strip()
         )
-    else:
+        latest_tag, commit_count, _ = description.rsplit("-", 2)
+        commit_count = int(commit_count)
+    except subprocess.CalledProcessError:
+        latest_tag = None
         commit_count = int(
             subprocess.check_output(["git", "rev-list", "--count", branch]).decode().strip()
         )
 
-    major_version = latest_tag.split(".")[0].split("v")[1] if latest_tag else "0"
-    minor_version = latest_tag.split(".")[1] if latest_tag else "0"
-    patch_version = int(latest_tag.split(".")[2]) + commit_count
+    major_version, minor_version, patch_version = (
+        latest_tag[1:].split(".", 2) if latest_tag else ("0", "0", "0")
+    )
+    patch_version = int(patch_version) + commit_count
 
     return f"{major_version}.{minor_version}.{patch_version}"
 
 
-def compare_version(new_version: str, old_version: str):
-    """Compare two versions"""
-    return list(map(int, new_version.split("."))) <= list(map(int, old_version.split(".")))
+def parse_version(version: str):
+    """Parse a version string into a tuple of integers"""
+    return tuple(int(part) for part in version.split("."))
 
 
 def update_version(version):
     """Update version on pyproject.toml"""
-    with open("pyproject.toml", "r", encoding="utf-8") as file:
-        original_content = file.readlines()
+    with open("pyproject.toml", "r+", encoding="utf-8") as file:
+        content = file.read()
+
+        match = re.search(r'^version = "([^"]+)"', content, re.M)
+        if match is None:
+            warn("No version found in pyproject.toml")
+            return
 
-    updated_content = []
-    for line in original_content:
         # Check if the new version is greater than the old version
-        if line.startswith("version =") and compare_version(version, line.split('"')[1]):
+        if parse_version(version) <= parse_version(match.group(1)):
             warn("New version is not greater than the old version")
             return
 
-        if line.startswith("version ="):
-            updated_content.append(f'version = "{version}"\n')
-        else:
-            updated_content.append(line)
-
-    with open("pyproject.toml", "w", encoding="utf-8") as file:
-        file.writelines(updated_content)
+        file.seek(0)
+        file.write(content[: match.start(1)] + version + content[match.end(1) :])
+        file.truncate()
 
 
 # Calculate the version and update pyproject.toml
@@ -12,35 +12,50 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Example for parallel plan execution."""
-import time
+import asyncio
+import os
+from dataclasses import dataclass
+from functools import lru_cache
 
 import unified_planning as up
+from plotting import plot_executable_graph, start_layout
 from unified_planning.model import EndTiming, StartTiming
 
 from up_esb.bridge import Bridge
 from up_esb.execution.parallel_executor import Executor
 
+# Set ESB_EXAMPLE_SLOW=1 to simulate the duration of the actions.
+SIMULATE_DURATION = bool(os.environ.get("ESB_EXAMPLE_SLOW"))
+
+
+async def simulate_duration(seconds: float):
+    """Sleep for the given duration, if enabled."""
+    if SIMULATE_DURATION:
+        await asyncio.sleep(seconds)
+
 
 # TODO: Better example
 #################### 1. Define the domain ####################
+@dataclass(frozen=True)
 class Location:
     """Location class."""
 
-    def __init__(self, name):
-        self.name = name
+    __slots__ = ("name",)
+    name: str
 
     def __repr__(self) -> str:
         return self.name
 
 
+@dataclass(frozen=True)
 class Area:
     """Area class."""
 
-    def __init__(self, x_from, x_to, y_from, y_to):
-        self.x_from = x_from
-        self.x_to = x_to
-        self.y_from = y_from
-        self.y_to = y_to
+    __slots__ = ("x_from", "x_to", "y_from", "y_to")
+    x_from: float
+    x_to: float
+    y_from: float
+    y_to: float
 
     def __repr__(self) -> str:
         return f"Area-{self.x_from}-{self.x_to}-{self.y_from}-{self.y_to}"
@@ -52,18 +67,18 @@ class Robot:
     location = "l1"
 
     @classmethod
-    def move(cls, l_from: Location, l_to: Location):
+    async def move(cls, l_from: Location, l_to: Location):
         """Move the robot from one location to another."""
 
         print(f"Moving from {l_from} to {l_to}")
         Robot.location = l_to
-        time.sleep(2)
+        await simulate_duration(2)
 
     @classmethod
-    def survey(cls, area: Area):
+    async def survey(cls, area: Area):
         """Survey the area."""
         print(f"Surveying area {area}")
-        time.sleep(5)
+        await simulate_duration(5)
 
     @classmethod
     def send_info(cls, location: Location):
@@ -82,11 +97,15 @@ def visited_fun(l: Location):
     return Robot.location == l
 
 
+# The following fluents do not depend on the robot's state, so their values can be cached.
+#  robot_at_fun and visited_fun read Robot.location and must be evaluated on every call.
+@lru_cache(maxsize=None)
 def is_surveyed_fun():
     """Check if the area is surveyed."""
     return True
 
 
+@lru_cache(maxsize=None)
 def info_sent_fun(_: Location):
     """Send info about the location."""
     return True
@@ -106,10 +125,8 @@ def define_problem():
     is_surveyed = bridge.create_fluent_from_function(is_surveyed_fun)
     info_sent = bridge.create_fluent_from_function(info_sent_fun)
 
-    l1 = bridge.create_object("l1", Location("l1"))
-    l2 = bridge.create_object("l2", Location("l2"))
-    l3 = bridge.create_object("l3", Location("l3"))
-    l4 = bridge.create_object("l4", Location("l4"))
+    locations = bridge.create_objects({name: Location(name) for name in ("l1", "l2", "l3", "l4")})
+    l1, l2, l3, l4 = locations
     _ = bridge.create_object("area", Area(0, 10, 0, 10))
 
     move, [l_from, l_to] = bridge.create_action(
@@ -130,23 +147,17 @@ def define_problem():
     send_info.add_effect(info_sent(l), True)
 
     problem = bridge.define_problem()
-    problem.set_initial_value(is_surveyed(), False)
-    problem.set_initial_value(robot_at(l1), True)
-    problem.set_initial_value(robot_at(l2), False)
-    problem.set_initial_value(robot_at(l3), False)
-    problem.set_initial_value(robot_at(l4), False)
-    problem.set_initial_value(visited(l1), True)
-    problem.set_initial_value(visited(l2), False)
-    problem.set_initial_value(visited(l3), False)
-    problem.set_initial_value(visited(l4), False)
-    problem.set_initial_value(info_sent(l1), False)
-    problem.set_initial_value(info_sent(l2), False)
-    problem.set_initial_value(info_sent(l3), False)
-    problem.set_initial_value(info_sent(l4), False)
-    problem.add_goal(visited(l2))
-    problem.add_goal(visited(l3))
-    problem.add_goal(visited(l4))
-    problem.add_goal(robot_at(l4))
+    bridge.set_initial_values(
+        problem,
+        {
+            is_surveyed(): False,
+            **{robot_at(l): l is l1 for l in locations},
+            **{visited(l): l is l1 for l in locations},
+            **{info_sent(l): False for l in locations},
+        },
+    )
+    for goal in (visited(l2), visited(l3), visited(l4), robot_at(l4)):
+        problem.add_goal(goal)
 
     return bridge, problem
 
@@ -158,6 +169,7 @@ def main():
     executor = Executor()
 
     plan = bridge.solve(problem, planner_name="aries", optimize_with_default_metric=False)
+    bridge.close()
     print("*" * 10)
     print("* Plan *")
     for action in plan.timed_actions:
@@ -165,9 +177,10 @@ def main():
     print("*" * 10)
 
     graph_executor = bridge.get_executable_graph(plan)
+    layout = start_layout(graph_executor)
     executor.execute(graph_executor)
 
-    # TODO: Add visualization
+    plot_executable_graph(graph_executor, layout)
 
 
 if __name__ == "__main__":
@@ -19,6 +19,7 @@
 """Example for parallel execution of a partial order plan."""
 from pprint import pprint
 
+import networkx as nx
 import unified_planning as up
 from parallel import (
     Area,
@@ -29,6 +30,7 @@ from parallel import (
     robot_at_fun,
     visited_fun,
 )
+from plotting import plot_executable_graph, start_layout
 from unified_planning.shortcuts import PlanKind
 
 from up_esb.bridge import Bridge
@@ -65,29 +67,21 @@ def define_problem():
     # send_info.add_precondition(is_surveyed())
     send_info.add_effect(info_sent(l), True)
 
-    l1 = bridge.create_object("l1", Location("l1"))
-    l2 = bridge.create_object("l2", Location("l2"))
-    l3 = bridge.create_object("l3", Location("l3"))
-    l4 = bridge.create_object("l4", Location("l4"))
+    locations = bridge.create_objects({name: Location(name) for name in ("l1", "l2", "l3", "l4")})
+    l1, l2, l3, l4 = locations
 
     problem = bridge.define_problem()
-    problem.set_initial_value(is_surveyed(), True)
-    problem.set_initial_value(robot_at(l1), True)
-    problem.set_initial_value(robot_at(l2), False)
-    problem.set_initial_value(robot_at(l3), False)
-    problem.set_initial_value(robot_at(l4), False)
-    problem.set_initial_value(visited(l1), True)
-    problem.set_initial_value(visited(l2), False)
-    problem.set_initial_value(visited(l3), False)
-    problem.set_initial_value(visited(l4), False)
-    problem.set_initial_value(info_sent(l1), False)
-    problem.set_initial_value(info_sent(l2), False)
-    problem.set_initial_value(info_sent(l3), False)
-    problem.set_initial_value(info_sent(l4), False)
-    problem.add_goal(visited(l2))
-    problem.add_goal(visited(l3))
-    problem.add_goal(visited(l4))
-    problem.add_goal(robot_at(l4))
+    bridge.set_initial_values(
+        problem,
+        {
+            is_surveyed(): True,
+            **{robot_at(l): l is l1 for l in locations},
+            **{visited(l): l is l1 for l in locations},
+            **{info_sent(l): False for l in locations},
+        },
+    )
+    for goal in (visited(l2), visited(l3), visited(l4), robot_at(l4)):
+        problem.add_goal(goal)
     return bridge, problem
 
 
@@ -97,6 +91,7 @@ def main():
     bridge, problem = define_problem()
 
     plan = bridge.solve(problem)  # By default, chooses a planner based on its problem.kind
+    bridge.close()
     print("*" * 10)
     print("* Plan *")
     for action in plan.actions:
@@ -113,10 +108,16 @@ def main():
         raise ValueError("Plan is not a SequentialPlan")
 
     dependency_graph = bridge.get_executable_graph(plan)
+    # Drop transitively implied orderings, so that more actions can be executed in parallel.
+    reduced_graph = nx.transitive_reduction(dependency_graph)
+    reduced_graph.add_nodes_from(dependency_graph.nodes(data=True))
+    dependency_graph = reduced_graph
+
+    layout = start_layout(dependency_graph)
     executor = Executor()
     executor.execute(dependency_graph)
 
-    # TODO: Add visualization
+    plot_executable_graph(dependency_graph, layout)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,60 @@
+# Copyright 2022 Selvakumar H S, LAAS-CNRS
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Optional visualization of executable graphs for the examples."""
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional
+
+import networkx as nx
+
+# Set ESB_PLOT=1 to plot the executable graphs.
+PLOT = bool(os.environ.get("ESB_PLOT"))
+
+
+def compute_layout(graph: nx.DiGraph) -> dict:
+    """Compute node positions for the executable graph."""
+    try:
+        return nx.nx_pydot.pydot_layout(graph, prog="dot")
+    except (ImportError, OSError):
+        # pydot or Graphviz is not available
+        return nx.spring_layout(graph, seed=0)
+
+
+def start_layout(graph: nx.DiGraph) -> Optional[Future]:
+    """Start computing the layout in the background while the plan executes, if plotting."""
+    if not PLOT:
+        return None
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    layout = executor.submit(compute_layout, graph)
+    executor.shutdown(wait=False)
+    return layout
+
+
+def plot_executable_graph(graph: nx.DiGraph, layout: Optional[Future] = None):
+    """Plot the executable graph, if plotting is enabled."""
+    if not PLOT:
+        return
+
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
+    nx.draw(
+        graph,
+        layout.result() if layout is not None else compute_layout(graph),
+        labels=nx.get_node_attributes(graph, "node_name"),
+        with_labels=True,
+        node_size=1000,
+        font_size=8,
+    )
+    plt.show()
@@ -21,7 +21,16 @@ from up_esb.plexmo import PlanDispatcher
 
 
 class Location:
-    """Location class for the robot example"""
+    """Location class for the robot example, interned by name so equal locations are identical"""
+
+    __slots__ = ("name",)
+    _instances = {}
+
+    def __new__(cls, name):
+        instance = cls._instances.get(name)
+        if instance is None:
+            instance = cls._instances[name] = super().__new__(cls)
+        return instance
 
     def __init__(self, name):
         self.name = name
@@ -29,14 +38,18 @@ class Location:
     def __repr__(self):
         return f"Location({self.name})"
 
-    def __eq__(self, __value: object) -> bool:
-        if isinstance(__value, Location):
-            return self.name == __value.name
-        return False
-
 
 class Area:
-    """Area class for the robot example"""
+    """Area class for the robot example, interned by name so equal areas are identical"""
+
+    __slots__ = ("name",)
+    _instances = {}
+
+    def __new__(cls, name):
+        instance = cls._instances.get(name)
+        if instance is None:
+            instance = cls._instances[name] = super().__new__(cls)
+        return instance
 
     def __init__(self, name):
         self.name = name
@@ -44,11 +57,6 @@ class Area:
     def __repr__(self):
         return f"Area({self.name})"
 
-    def __eq__(self, __value: object) -> bool:
-        if isinstance(__value, Area):
-            return self.name == __value.name
-        return False
-
 
 class Robot:
     """Robot class."""
@@ -57,7 +65,7 @@ class Robot:
     surveyed = False
     plates = False
     distance_optimized = False
-    locations_inspected = []
+    locations_inspected = set()
 
     @classmethod
     def move(cls, l_from: Location, l_to: Location):
@@ -93,14 +101,14 @@ class Robot:
     def inspect_plate(cls, l: Location):
         """Inspect the plate at a location."""
         print(f"Inspecting plate at location {l}")
-        Robot.locations_inspected.append(l)
+        Robot.locations_inspected.add(l)
         return True
 
 
 # Fluent definitions
 def robot_at_fun(l: Location):
     """Check if the robot is at a location."""
-    return Robot.location == l
+    return Robot.location is l
 
 
 def is_surveyed_fun():
@@ -227,6 +235,7 @@ def main():
     dispatcher = PlanDispatcher()
 
     plan = bridge.solve(problem, planner_name="aries", optimize_with_default_metric=False)
+    bridge.close()
     print("*" * 10)
     print("* Plan *")
     for action in plan.timed_actions:
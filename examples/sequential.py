@@ -13,6 +13,7 @@
 # limitations under the License.
 """Example for sequential plan execution."""
 import unified_planning as up
+from plotting import plot_executable_graph, start_layout
 
 from up_esb.bridge import Bridge
 from up_esb.plexmo import PlanDispatcher
@@ -20,7 +21,16 @@ from up_esb.plexmo import PlanDispatcher
 
 #################### 1. Define the domain ####################
 class Location:
-    """Location class."""
+    """Location class, interned by name so equal locations are identical."""
+
+    __slots__ = ("name",)
+    _instances = {}
+
+    def __new__(cls, name):
+        instance = cls._instances.get(name)
+        if instance is None:
+            instance = cls._instances[name] = super().__new__(cls)
+        return instance
 
     def __init__(self, name):
         self.name = name
@@ -28,9 +38,6 @@ class Location:
     def __repr__(self) -> str:
         return self.name
 
-    def __eq__(self, other):
-        return self.name == other.name
-
 
 class Robot:
     """Robot class."""
@@ -49,12 +56,12 @@ class Robot:
 
 def robot_at_fun(l: Location):
     """Check if the robot is at a location."""
-    return Robot.location == l
+    return Robot.location is l
 
 
 def visited_fun(l: Location):
     """Check if the location is visited."""
-    return Robot.location == l
+    return Robot.location is l
 
 
 #################### 2. Define the problem ####################
@@ -69,10 +76,8 @@ def define_problem():
     robot_at = bridge.create_fluent_from_function(robot_at_fun)
     visited = bridge.create_fluent_from_function(visited_fun)
 
-    l1 = bridge.create_object("l1", Location("l1"))
-    l2 = bridge.create_object("l2", Location("l2"))
-    l3 = bridge.create_object("l3", Location("l3"))
-    l4 = bridge.create_object("l4", Location("l4"))
+    locations = bridge.create_objects({name: Location(name) for name in ("l1", "l2", "l3", "l4")})
+    l1, l2, l3, l4 = locations
 
     move, [l_from, l_to] = bridge.create_action(
         "Move", _callable=Robot.move, l_from=Location, l_to=Location
@@ -83,18 +88,15 @@ def define_problem():
     move.add_effect(visited(l_to), True)
 
     problem = bridge.define_problem()
-    problem.set_initial_value(robot_at(l1), True)
-    problem.set_initial_value(robot_at(l2), False)
-    problem.set_initial_value(robot_at(l3), False)
-    problem.set_initial_value(robot_at(l4), False)
-    problem.set_initial_value(visited(l1), True)
-    problem.set_initial_value(visited(l2), False)
-    problem.set_initial_value(visited(l3), False)
-    problem.set_initial_value(visited(l4), False)
-    problem.add_goal(visited(l2))
-    problem.add_goal(visited(l3))
-    problem.add_goal(visited(l4))
-    problem.add_goal(robot_at(l4))
+    bridge.set_initial_values(
+        problem,
+        {
+            **{robot_at(l): l is l1 for l in locations},
+            **{visited(l): l is l1 for l in locations},
+        },
+    )
+    for goal in (visited(l2), visited(l3), visited(l4), robot_at(l4)):
+        problem.add_goal(goal)
 
     return bridge, problem
 
@@ -106,6 +108,7 @@ def main():
     dispatcher = PlanDispatcher()
 
     plan = bridge.solve(problem, planner_name="pyperplan")
+    bridge.close()
 
     print("*" * 10)
     print("* Plan *")
@@ -114,9 +117,10 @@ def main():
     print("*" * 10)
 
     graph_executor = bridge.get_executable_graph(plan)
+    layout = start_layout(graph_executor)
     dispatcher.execute_plan(plan, graph_executor)
 
-    # TODO: Add visualization
+    plot_executable_graph(graph_executor, layout)
 
 
 if __name__ == "__main__":
@@ -13,19 +13,34 @@
 # limitations under the License.
 """Example for time triggered plan execution."""
 
+import os
 import time
+from functools import lru_cache
 
 import unified_planning as up
+from plotting import plot_executable_graph, start_layout
 from unified_planning.model import EndTiming, StartTiming
 from unified_planning.shortcuts import Not
 
 from up_esb.bridge import Bridge
 from up_esb.plexmo import PlanDispatcher
 
+# Set ESB_EXAMPLE_SLOW=1 to simulate the duration of the actions.
+SIMULATE_DURATION = bool(os.environ.get("ESB_EXAMPLE_SLOW"))
+
 
 #################### 1. Define the domain ####################
 class Location:
-    """Location class."""
+    """Location class, interned by name so equal locations are identical."""
+
+    __slots__ = ("name",)
+    _instances = {}
+
+    def __new__(cls, name):
+        instance = cls._instances.get(name)
+        if instance is None:
+            instance = cls._instances[name] = super().__new__(cls)
+        return instance
 
     def __init__(self, name):
         self.name = name
@@ -33,9 +48,6 @@ class Location:
     def __repr__(self) -> str:
         return self.name
 
-    def __eq__(self, other):
-        return self.name == other.name
-
 
 class Robot:
     """Robot class."""
@@ -48,30 +60,32 @@ class Robot:
 
         print(f"Moving from {l_from} to {l_to}")
         Robot.location = l_to
-        time.sleep(2)
+        if SIMULATE_DURATION:
+            time.sleep(2)
 
         return True
 
 
 def robot_at_fun(l: Location):
     """Check if the robot is at a location."""
-    return Robot.location == l
+    return Robot.location is l
 
 
 def visited_fun(l: Location):
     """Check if the location is visited."""
-    return Robot.location == l
+    return Robot.location is l
 
 
 def is_connected_fun(l1: Location, l2: Location):
     """Check if two locations are connected."""
     # TODO: Bridge cannot handle initial states at the moment
-    return l1 != l2  # Dummy condition
+    return l1 is not l2  # Dummy condition
 
 
 #################### 2. Define the problem ####################
-def define_problem():
-    """Define the problem."""
+@lru_cache(maxsize=1)
+def build_domain():
+    """Create the bridge with all types, fluents, objects and actions of the domain once."""
     bridge = Bridge()
 
     bridge.create_types([Robot, Location])
@@ -80,12 +94,10 @@ def define_problem():
     visited = bridge.create_fluent_from_function(visited_fun)
     is_connected = bridge.create_fluent_from_function(is_connected_fun)
 
-    l1 = bridge.create_object("l1", Location("l1"))
-    l2 = bridge.create_object("l2", Location("l2"))
-    l3 = bridge.create_object("l3", Location("l3"))
-    l4 = bridge.create_object("l4", Location("l4"))
-    l5 = bridge.create_object("l5", Location("l5"))
-    r1 = bridge.create_object("r1", Robot())
+    locations = bridge.create_objects(
+        {name: Location(name) for name in ("l1", "l2", "l3", "l4", "l5")}
+    )
+    bridge.create_object("r1", Robot())
 
     dur_move, [l_from, l_to] = bridge.create_action(
         "Move", _callable=Robot.move, l_from=Location, l_to=Location, duration=10
@@ -97,18 +109,27 @@ def define_problem():
     dur_move.add_effect(EndTiming(), robot_at(l_from), False)
     dur_move.add_effect(EndTiming(), visited(l_to), True)
 
+    return bridge, (robot_at, visited, is_connected), locations
+
+
+def define_problem():
+    """Define the problem."""
+    bridge, (robot_at, visited, is_connected), locations = build_domain()
+    l1 = locations[0]
+
     problem = bridge.define_problem()
     bridge.set_initial_values(problem)
-    problem.set_initial_value(robot_at(l1), True)
-    problem.set_initial_value(visited(l1), True)
-    problem.set_initial_value(is_connected(l1, l2), True)
-    problem.set_initial_value(is_connected(l2, l3), True)
-    problem.set_initial_value(is_connected(l3, l4), True)
-    problem.set_initial_value(is_connected(l4, l5), True)
-    problem.add_goal(visited(l2))
-    problem.add_goal(visited(l3))
-    problem.add_goal(visited(l4))
-    problem.add_goal(visited(l5))
+    # The locations form a chain, each one connected to the next.
+    bridge.set_initial_values(
+        problem,
+        {
+            robot_at(l1): True,
+            visited(l1): True,
+            **{is_connected(l_from, l_to): True for l_from, l_to in zip(locations, locations[1:])},
+        },
+    )
+    for l in locations[1:]:
+        problem.add_goal(visited(l))
     return bridge, problem
 
 
@@ -119,6 +140,7 @@ def main():
     dispatcher = PlanDispatcher()
 
     plan = bridge.solve(problem, planner_name="aries", optimize_with_default_metric=False)
+    bridge.close()
     print("*" * 10)
     print("* Plan *")
     for action in plan.timed_actions:
@@ -126,9 +148,10 @@ def main():
     print("*" * 10)
 
     graph_executor = bridge.get_executable_graph(plan)
+    layout = start_layout(graph_executor)
     dispatcher.execute_plan(plan, graph_executor)
 
-    # TODO: Add visualization
+    plot_executable_graph(graph_executor, layout)
 
 
 if __name__ == "__main__":
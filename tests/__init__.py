@@ -1,193 +1,193 @@
 """This module contains the example plans that are used for testing purposes.""" ""
-from typing import List, Union
+from collections import deque
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain
+from typing import Callable, Dict, List, Union
 
 from unified_planning.plans import SequentialPlan, TimeTriggeredPlan
 from unified_planning.shortcuts import OperatorKind, get_environment
 from unified_planning.test.examples import get_example_problems
 
-available_plans = [
-    "basic",
-    "basic_conditional",
-    "basic_oversubscription",
-    "complex_conditional",
-    "basic_without_negative_preconditions",
-    "basic_nested_conjunctions",
-    "basic_exists",
-    "basic_forall",
-    "temporal_conditional",
-    "basic_with_costs",
-    "counter",
-    "counter_to_50",
-    "basic_with_object_constant",
-    "robot",
-    "robot_fluent_of_user_type",
-    "robot_no_negative_preconditions",
-    "robot_decrease",
-    "robot_loader",
-    "robot_loader_mod",
-    "robot_loader_adv",
-    "robot_locations_connected",
-    "robot_locations_visited",
-    "charge_discharge",
-    "matchcellar",
-    "timed_connected_locations",
-    "hierarchical_blocks_world",
-    "robot_with_static_fluents_duration",
-    "travel",
-    "robot_real_constants",
-    "robot_int_battery",
-    "robot_fluent_of_user_type_with_int_id",
-    "robot_locations_connected_without_battery",
-    "hierarchical_blocks_world_exists",
-    "hierarchical_blocks_world_object_as_root",
-    "hierarchical_blocks_world_with_object",
-    "travel_with_consumptions",
-    "matchcellar_static_duration",
-    "locations_connected_visited_oversubscription",
-    "locations_connected_cost_minimize",
-    "htn-go",
-    "htn-go-temporal",
-]
+# pylint: disable=protected-access
+
+available_plans = frozenset(
+    [
+        "basic",
+        "basic_conditional",
+        "basic_oversubscription",
+        "complex_conditional",
+        "basic_without_negative_preconditions",
+        "basic_nested_conjunctions",
+        "basic_exists",
+        "basic_forall",
+        "temporal_conditional",
+        "basic_with_costs",
+        "counter",
+        "counter_to_50",
+        "basic_with_object_constant",
+        "robot",
+        "robot_fluent_of_user_type",
+        "robot_no_negative_preconditions",
+        "robot_decrease",
+        "robot_loader",
+        "robot_loader_mod",
+        "robot_loader_adv",
+        "robot_locations_connected",
+        "robot_locations_visited",
+        "charge_discharge",
+        "matchcellar",
+        "timed_connected_locations",
+        "hierarchical_blocks_world",
+        "robot_with_static_fluents_duration",
+        "travel",
+        "robot_real_constants",
+        "robot_int_battery",
+        "robot_fluent_of_user_type_with_int_id",
+        "robot_locations_connected_without_battery",
+        "hierarchical_blocks_world_exists",
+        "hierarchical_blocks_world_object_as_root",
+        "hierarchical_blocks_world_with_object",
+        "travel_with_consumptions",
+        "matchcellar_static_duration",
+        "locations_connected_visited_oversubscription",
+        "locations_connected_cost_minimize",
+        "htn-go",
+        "htn-go-temporal",
+    ]
+)
 
 # TODO: The following plans are not supported yet
 # MINUS, EXISTS, FORALL
 # INCREASED_EFFECT, DECREASED_EFFECT
-PLANS_WITH_UNSUPPORTED_OPERATORS = [
-    "basic_nested_conjunctions",
-    "basic_exists",
-    "basic_forall",
-    "counter",
-    "robot",
-    "robot_locations_connected",
-    "charge_discharge",
-    "timed_connected_locations",
-    "robot_real_constants",
-    "robot_int_battery",
-    "robot_locations_connected_without_battery",
-    "travel_with_consumptions",
-    "travel",
-]
+PLANS_WITH_UNSUPPORTED_OPERATORS = frozenset(
+    [
+        "basic_nested_conjunctions",
+        "basic_exists",
+        "basic_forall",
+        "counter",
+        "robot",
+        "robot_locations_connected",
+        "charge_discharge",
+        "timed_connected_locations",
+        "robot_real_constants",
+        "robot_int_battery",
+        "robot_locations_connected_without_battery",
+        "travel_with_consumptions",
+        "travel",
+    ]
+)
 
 # TODO: Hierarchical plans are not supported yet
-UNSUPPORTED_PLANS = [
-    "htn-go",
-    "htn-go-temporal",
-]
+UNSUPPORTED_PLANS = frozenset(
+    [
+        "htn-go",
+        "htn-go-temporal",
+    ]
+)
 
-available_plans = list(set(available_plans) - set(PLANS_WITH_UNSUPPORTED_OPERATORS))
-available_plans = list(set(available_plans) - set(UNSUPPORTED_PLANS))
+available_plans = available_plans - PLANS_WITH_UNSUPPORTED_OPERATORS - UNSUPPORTED_PLANS
 
+_EXPRESSION_MANAGER = get_environment().expression_manager
 
+
+def _iter_fluents(condition):
+    """Yield every fluent expression in the condition, however deeply nested."""
+    stack = deque(_EXPRESSION_MANAGER.auto_promote(condition))
+    while stack:
+        node = stack.pop()
+        if node.node_type is OperatorKind.FLUENT_EXP:
+            yield node
+        stack.extend(node.args)
+
+
+@lru_cache(maxsize=1)
+def _get_example_problems():
+    """Build the unified planning example problems once per test session."""
+    return get_example_problems()
+
+
+@lru_cache(maxsize=1)
 def get_example_plans() -> Union[List[SequentialPlan], List[TimeTriggeredPlan]]:
     """Gain access to the example plans."""
-    example_problems = get_example_problems()
-
-    plans = {}
-    for element in example_problems:
-        if element in available_plans:
-            plans[element] = example_problems[element].valid_plans[-1]
+    example_problems = _get_example_problems()
 
-    return plans
+    return {
+        name: problem.valid_plans[-1]
+        for name, problem in example_problems.items()
+        if name in available_plans
+    }
 
 
+@dataclass
 class ContextManager:
     """Convert plan to executable functions for testing purposes."""
 
-    objects_context = {}
-    fluents_context = {}
-    actions_context = {}
     plan: Union[SequentialPlan, TimeTriggeredPlan]
+    objects_context: Dict[str, type] = field(default_factory=dict)
+    fluents_context: Dict[str, Callable] = field(default_factory=dict)
+    actions_context: Dict[str, Callable] = field(default_factory=dict)
+
+    # Actions and fluents are only ever called for their return value, so they share these stubs.
+    _true_function = staticmethod(lambda *args, **kwargs: True)
+    _false_function = staticmethod(lambda *args, **kwargs: False)
+
+    def __post_init__(self):
+        # Resolve the plan kind once, so the getters work on plain action instances.
+        self._temporal = isinstance(self.plan, TimeTriggeredPlan)
+        if self._temporal:
+            self._actions = [action for _, action, _ in self.plan.timed_actions]
+        else:
+            self._actions = self.plan.actions
 
-    @classmethod
-    def get_actions_context(cls, returns: bool = True):
+    def get_actions_context(self, returns: bool = True):
         """Get the actions context."""
+        return self._translate_context(self._actions, returns=returns)
 
-        if isinstance(cls.plan, TimeTriggeredPlan):
-            return cls._translate_context(cls.plan.timed_actions, returns=returns)
-        else:
-            return cls._translate_context(cls.plan.actions, returns=returns)
-
-    @classmethod
-    def get_objects_context(cls):
+    def get_objects_context(self):
         """Get the objects context."""
-
-        actions = []
-        if isinstance(cls.plan, TimeTriggeredPlan):
-            actions = cls.plan.timed_actions
-            actions = [action[1] for action in actions]
-        else:
-            actions = cls.plan.actions
-
-        for action in actions:
+        # Generate each object class only once, even if it is used by several actions.
+        for action in self._actions:
             for param in action.actual_parameters:
-                cls.objects_context[str(param)] = cls._generate_class(
-                    param, str(param), returns=True
-                )
+                name = str(param)
+                if name not in self.objects_context:
+                    self.objects_context[name] = self._generate_class(param, name, returns=True)
 
-        return cls.objects_context
+        return self.objects_context
 
-    @classmethod
-    def get_fluents_context(cls):
+    def get_fluents_context(self):
         """Get the fluents context."""
-        manager = get_environment().expression_manager
-
         conditions = []
-        if isinstance(cls.plan, TimeTriggeredPlan):
-            for action in cls.plan.timed_actions:
-                for preconditions in action[1].action.conditions.values():
-                    for condition in preconditions:
-                        conditions.append(condition)
-                for effects in action[1].action.effects.values():
-                    for effect in effects:
-                        conditions.append(effect.fluent)
+        if self._temporal:
+            for action in self._actions:
+                conditions.extend(chain.from_iterable(action.action.conditions.values()))
+                effects = chain.from_iterable(action.action.effects.values())
+                conditions.extend(effect.fluent for effect in effects)
         else:
-            for action in cls.plan.actions:
+            for action in self._actions:
                 conditions.extend(action.action.preconditions)
-                conditions.extend([effect.fluent for effect in action.action.effects])
+                conditions.extend(effect.fluent for effect in action.action.effects)
 
         for condition in conditions:
-            expression = manager.auto_promote(condition)
-            # TODO: Refactor this
-            for exp in expression:
-                if exp.node_type is not OperatorKind.FLUENT_EXP:
-                    args = exp.args
-                    for arg in args:
-                        if arg.node_type is OperatorKind.FLUENT_EXP:
-                            arg_name = str(arg).split("(", maxsplit=1)[0]
-                            cls.fluents_context[arg_name] = cls._generate_function(
-                                arg, arg_name, returns=True
-                            )
-                else:
-                    exp_name = str(exp).split("(", maxsplit=1)[0]
-                    cls.fluents_context[exp_name] = cls._generate_function(
-                        exp, exp_name, returns=True
-                    )
-
-        return cls.fluents_context
+            for fluent in _iter_fluents(condition):
+                self.fluents_context[fluent.fluent().name] = self._generate_function(returns=True)
 
-    @classmethod
-    def _translate_context(cls, actions, returns: bool = True):
+        return self.fluents_context
+
+    def _translate_context(self, actions, returns: bool = True):
         """Translate the actions context."""
         for action in actions:
-            action_name = ""
-            if isinstance(cls.plan, TimeTriggeredPlan):
-                action_name = action[1].action.name
-            else:
-                action_name = action.action.name
-            func = cls._generate_function(action, action_name, returns=returns)
-            setattr(cls, action_name, func)
-            cls.actions_context[action_name] = func
+            action_name = action.action.name
+            func = self._generate_function(returns=returns)
+            setattr(self, action_name, func)
+            self.actions_context[action_name] = func
 
-        return cls.actions_context
+        return self.actions_context
 
     @classmethod
-    def _generate_function(cls, expression, expression_name, returns: bool = True):
-        def function(*args, **kwargs):
-            return returns
-
-        function.__name__ = expression_name
-
-        return function
+    def _generate_function(cls, returns: bool = True):
+        """Get the shared stub returning `returns`, whatever it is called with."""
+        return cls._true_function if returns else cls._false_function
 
     @classmethod
     def _generate_class(cls, expression, expression_name, returns: bool = True):
@@ -204,3 +204,24 @@ class ContextManager:
         GeneratedClass.__name__ = expression_name
 
         return GeneratedClass
+
+
+@lru_cache(maxsize=None)
+def _get_contexts(plan):
+    """Build the stub contexts of a plan once."""
+    context = ContextManager(plan)
+    return (
+        context.get_actions_context(returns=True),
+        context.get_fluents_context(),
+        context.get_objects_context(),
+    )
+
+
+def prime_bridge(bridge, plan):
+    """Set up the bridge with stub actions, fluents and objects for the plan."""
+    actions, fluents, objects = _get_contexts(plan)
+    # Copies, since the bridge registers new objects and functions in place.
+    bridge._api_actions = dict(actions)
+    bridge._fluent_functions = dict(fluents)
+    bridge._api_objects = dict(objects)
+    return bridge
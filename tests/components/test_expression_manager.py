@@ -1,4 +1,7 @@
+import ast
 import unittest
+from types import CodeType
+from typing import Dict
 
 from unified_planning.shortcuts import *  # pylint: disable=unused-wildcard-import
 
@@ -8,10 +11,24 @@ from up_esb.components.expression_manager import ExpressionManager
 # pylint: disable=missing-docstring, line-too-long, eval-used
 
 
+_CODE_CACHE: Dict[str, CodeType] = {}
+
+
+def _eval(tree: ast.Expression, **names):
+    """Evaluate the tree, compiling each distinct tree only once."""
+    key = ast.dump(tree)
+    code = _CODE_CACHE.get(key)
+    if code is None:
+        code = _CODE_CACHE[key] = compile(tree, filename="<ast>", mode="eval")
+    return eval(code, globals(), names)
+
+
 # Example fluents
 
 
 class TestObject:
+    __slots__ = ("value",)
+
     def __init__(self, value: int):
         """Test object."""
         self.value = value
@@ -64,101 +81,91 @@ def fluent_arg_object(arg: TestObject) -> TestObject:
 class TestExpressionManager(unittest.TestCase):
     """Test conversion of FNode to AST tree."""
 
-    def setUp(self) -> None:
-        self.bridge = Bridge()
-        self._fluent_bool_1 = self.bridge.create_fluent_from_function(fluent_bool_1_fun)
-        self._fluent_bool_2 = self.bridge.create_fluent_from_function(fluent_bool_2_fun)
-        self._fluent_int_1 = self.bridge.create_fluent_from_function(fluent_int_1_fun)
-        self._fluent_real_1 = self.bridge.create_fluent_from_function(fluent_real_1_fun)
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.bridge = Bridge()
+        cls._fluent_bool_1 = cls.bridge.create_fluent_from_function(fluent_bool_1_fun)
+        cls._fluent_bool_2 = cls.bridge.create_fluent_from_function(fluent_bool_2_fun)
+        cls._fluent_int_1 = cls.bridge.create_fluent_from_function(fluent_int_1_fun)
+        cls._fluent_real_1 = cls.bridge.create_fluent_from_function(fluent_real_1_fun)
+
+        cls._fluent_arg_bool_1 = cls.bridge.create_fluent_from_function(fluent_arg_bool_1_fun)
+        cls._fluent_arg_int_1 = cls.bridge.create_fluent_from_function(fluent_arg_int_1_fun)
 
-        self._fluent_arg_bool_1 = self.bridge.create_fluent_from_function(fluent_arg_bool_1_fun)
-        self._fluent_arg_int_1 = self.bridge.create_fluent_from_function(fluent_arg_int_1_fun)
+        cls.bridge.create_types([TestObject])
+        cls._fluent_arg_object = cls.bridge.create_fluent_from_function(fluent_arg_object)
 
-        self.bridge.create_types([TestObject])
-        self._fluent_arg_object = self.bridge.create_fluent_from_function(fluent_arg_object)
+        cls.ast = ExpressionManager()
 
-        self.ast = ExpressionManager()
+    def _assert_evaluates(self, cases, **names):
+        """Convert each expression and check what it evaluates to."""
+        for expression, expected in cases:
+            with self.subTest(expression=expression):
+                self.assertEqual(_eval(self.ast.convert(expression), **names), expected)
 
     def test_simple_fluents(self):
         """Test simple fluents."""
-        result = self.ast.convert(Not(self._fluent_bool_1))
-        actual = eval(compile(result, filename="<ast>", mode="eval"))
-        self.assertEqual(actual, False)
-
-        result = self.ast.convert(And(self._fluent_bool_1, self._fluent_bool_2))
-        actual = eval(compile(result, filename="<ast>", mode="eval"))
-        self.assertEqual(actual, False)
-
-        result = self.ast.convert(Or(self._fluent_bool_1, self._fluent_bool_2))
-        actual = eval(compile(result, filename="<ast>", mode="eval"))
-        self.assertEqual(actual, True)
+        self._assert_evaluates(
+            [
+                (Not(self._fluent_bool_1), False),
+                (And(self._fluent_bool_1, self._fluent_bool_2), False),
+                (Or(self._fluent_bool_1, self._fluent_bool_2), True),
+            ]
+        )
 
     def test_simple_nested_fluents(self):
-        result = self.ast.convert(Not(And(self._fluent_int_1, self._fluent_int_1)))
-        actual = eval(compile(result, filename="<ast>", mode="eval"))
-        self.assertEqual(actual, False)
-
-        result = self.ast.convert(Not(And(self._fluent_real_1, self._fluent_real_1)))
-        actual = eval(compile(result, filename="<ast>", mode="eval"))
-        self.assertEqual(actual, False)
-
-        result = self.ast.convert(Not(And(self._fluent_bool_1, self._fluent_bool_2)))
-        actual = eval(compile(result, filename="<ast>", mode="eval"))
-        self.assertEqual(actual, True)
-
-        result = self.ast.convert(Not(And(self._fluent_bool_1, self._fluent_bool_1)))
-        actual = eval(compile(result, filename="<ast>", mode="eval"))
-        self.assertEqual(actual, False)
+        self._assert_evaluates(
+            [
+                (Not(And(self._fluent_int_1, self._fluent_int_1)), False),
+                (Not(And(self._fluent_real_1, self._fluent_real_1)), False),
+                (Not(And(self._fluent_bool_1, self._fluent_bool_2)), True),
+                (Not(And(self._fluent_bool_1, self._fluent_bool_1)), False),
+            ]
+        )
 
     def test_simple_fluents_with_args(self):
-        result = self.ast.convert(self._fluent_arg_bool_1(True))
-        actual = eval(compile(result, filename="<ast>", mode="eval"))
-        self.assertEqual(actual, True)
-
-        result = self.ast.convert(Not(self._fluent_arg_bool_1(False)))
-        actual = eval(compile(result, filename="<ast>", mode="eval"))
-        self.assertEqual(actual, True)
-
-        result = self.ast.convert(Not(self._fluent_arg_int_1(1)))
-        actual = eval(compile(result, filename="<ast>", mode="eval"))
-        self.assertEqual(actual, False)
-
-    def test_simple_nested_fluents_with_args(self):
-        result = self.ast.convert(Not(And(self._fluent_arg_int_1(1), self._fluent_arg_int_1(1))))
-        actual = eval(compile(result, filename="<ast>", mode="eval"))
-        self.assertEqual(actual, False)
-
-        result = self.ast.convert(
-            Not(And(self._fluent_arg_bool_1(True), self._fluent_arg_bool_1(False)))
+        self._assert_evaluates(
+            [
+                (self._fluent_arg_bool_1(True), True),
+                (Not(self._fluent_arg_bool_1(False)), True),
+                (Not(self._fluent_arg_int_1(1)), False),
+            ]
         )
-        actual = eval(compile(result, filename="<ast>", mode="eval"))
-        self.assertEqual(actual, True)
 
-        result = self.ast.convert(
-            Not(And(self._fluent_arg_bool_1(True), self._fluent_arg_bool_1(True)))
+    def test_simple_nested_fluents_with_args(self):
+        self._assert_evaluates(
+            [
+                (Not(And(self._fluent_arg_int_1(1), self._fluent_arg_int_1(1))), False),
+                (Not(And(self._fluent_arg_bool_1(True), self._fluent_arg_bool_1(False))), True),
+                (Not(And(self._fluent_arg_bool_1(True), self._fluent_arg_bool_1(True))), False),
+            ]
         )
-        actual = eval(compile(result, filename="<ast>", mode="eval"))
-        self.assertEqual(actual, False)
 
         obj = self.bridge.create_object("obj", TestObject(1))
-        result = self.ast.convert(
-            Equals(self._fluent_arg_object(obj), self._fluent_arg_object(obj))
-        )
-        actual = eval(compile(result, filename="<ast>", mode="eval"))
-        self.assertEqual(actual, True)
-
         obj1 = self.bridge.create_object("obj1", TestObject(2))
-        result = self.ast.convert(
-            Equals(self._fluent_arg_object(obj), self._fluent_arg_object(obj1))
+        self._assert_evaluates(
+            [
+                (Equals(self._fluent_arg_object(obj), self._fluent_arg_object(obj)), True),
+                (Equals(self._fluent_arg_object(obj), self._fluent_arg_object(obj1)), False),
+            ],
+            obj=obj,
+            obj1=obj1,
         )
-        actual = eval(compile(result, filename="<ast>", mode="eval"))
+
+    def test_shared_subtrees(self):
+        first = self.ast.convert(Not(self._fluent_arg_int_1(1)))
+        second = self.ast.convert(And(self._fluent_bool_1, Not(self._fluent_arg_int_1(1))))
+        self.assertIs(second.body.values[1], first.body)
+
+        actual = _eval(second)
         self.assertEqual(actual, False)
 
 
 if __name__ == "__main__":
     t = TestExpressionManager()
-    t.setUp()
+    TestExpressionManager.setUpClass()
     t.test_simple_fluents()
     t.test_simple_nested_fluents()
     t.test_simple_fluents_with_args()
     t.test_simple_nested_fluents_with_args()
+    t.test_shared_subtrees()
@@ -0,0 +1,55 @@
+# Copyright 2023 LAAS
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Shared pytest fixtures."""
+import pytest
+from unified_planning.shortcuts import OneshotPlanner, get_environment
+
+from tests import get_example_plans, prime_bridge
+from up_esb.bridge import Bridge
+
+
+@pytest.fixture(
+    scope="session",
+    params=list(get_example_plans().items()),
+    ids=lambda item: item[0],
+)
+def prepared_plan(request):
+    """Bridge and executable graph for an example plan, built once per session."""
+    plan_name, plan = request.param
+
+    bridge = prime_bridge(Bridge(), plan)
+    graph = bridge.get_executable_graph(plan)
+
+    return plan_name, plan, bridge, graph
+
+
+def pytest_configure(config):  # pylint: disable=unused-argument
+    """Silence the planner credits once for the whole session."""
+    get_environment().credits_stream = None
+
+
+@pytest.fixture(scope="session")
+def oneshot_planner():
+    """Get the OneshotPlanner for a problem kind, created once per session."""
+    planners = {}
+
+    def get_planner(problem_kind):
+        if problem_kind not in planners:
+            planners[problem_kind] = OneshotPlanner(problem_kind=problem_kind)
+        return planners[problem_kind]
+
+    yield get_planner
+
+    for planner in planners.values():
+        planner.destroy()
@@ -14,36 +14,28 @@
 
 import pytest
 
-from tests import ContextManager, get_example_plans
-from up_esb.bridge import Bridge
 from up_esb.execution import ActionExecutor
 from up_esb.status import ActionNodeStatus, ConditionStatus
 
-# pylint: disable=protected-access
+SKIP_ACTIONS = frozenset(("start", "end"))
 
 
 class TestTaskExecutor:
     """Test the execution of instantaneous tasks."""
 
-    @pytest.mark.parametrize("plan_name, plan", get_example_plans().items())
-    def test_task_executor(self, plan_name, plan):
+    def test_task_executor(self, prepared_plan):
         """Test the execution of instantaneous tasks."""
-
-        bridge = Bridge()
-        ContextManager.plan = plan
-        bridge._api_actions = ContextManager.get_actions_context(returns=True)
-        bridge._api_objects = ContextManager.get_objects_context()
-        bridge._fluent_functions = ContextManager.get_fluents_context()
-        graph = bridge.get_executable_graph(plan)
+        plan_name, plan, _, graph = prepared_plan
 
         executor = ActionExecutor(graph, options={"verbose": True, "dry_run": True})
-        executor = executor.get_executor(plan)
-
-        if not isinstance(plan, executor.supported_plan_kind):
+        try:
+            executor = executor.get_executor(plan)
+        except NotImplementedError:
             pytest.skip(f"Skipping unsupported plan: {plan_name}")
+        assert isinstance(plan, executor.supported_plan_kind)
 
         for node_id, node in graph.nodes(data=True):
-            if node["action"] in ["start", "end"]:
+            if node["action"] in SKIP_ACTIONS:
                 continue
 
             result = executor.execute_action(node_id)
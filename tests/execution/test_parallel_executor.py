@@ -0,0 +1,113 @@
+# Copyright 2022 Selvakumar H S, LAAS-CNRS
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+from threading import Barrier
+
+import networkx as nx
+import pytest
+
+from up_esb.execution.parallel_executor import Executor
+
+
+def _graph(context, edges):
+    """Create an executable graph where each action node calls the context function of its name."""
+    graph = nx.DiGraph()
+    for node_id in {node_id for edge in edges for node_id in edge}:
+        action = node_id if node_id in context else "start" if node_id == "start" else "end"
+        graph.add_node(node_id, node_name=action, action=action, parameters={}, context=context)
+    graph.add_edges_from(edges)
+    return graph
+
+
+class TestParallelExecutor:
+    """Test the layered execution of dependency graphs."""
+
+    def test_independent_actions_run_concurrently(self):
+        barrier = Barrier(2, timeout=5)
+        calls = []
+        context = {
+            "a": lambda: calls.append(("a", barrier.wait())),
+            "b": lambda: calls.append(("b", barrier.wait())),
+            "c": lambda: calls.append("c") or True,
+        }
+        graph = _graph(
+            context,
+            [("start", "a"), ("start", "b"), ("a", "c"), ("b", "c"), ("c", "end")],
+        )
+
+        results = Executor(max_workers=2).execute(graph)
+
+        assert list(results) == ["a", "b", "c"] and results["c"] is True
+        assert {call[0] for call in calls[:2]} == {"a", "b"}
+        assert calls[2] == "c"
+
+    def test_failing_action_stops_execution(self):
+        calls = []
+
+        def fail():
+            raise RuntimeError("failed")
+
+        context = {"a": fail, "b": lambda: calls.append("b")}
+        graph = _graph(context, [("start", "a"), ("a", "b"), ("b", "end")])
+
+        with pytest.raises(RuntimeError, match="failed"):
+            Executor().execute(graph)
+        assert not calls
+
+    def test_coroutine_actions_are_awaited(self):
+        calls = []
+
+        async def action():
+            await asyncio.sleep(0)
+            calls.append("a")
+            return True
+
+        graph = _graph({"a": action}, [("start", "a"), ("a", "end")])
+
+        assert Executor().execute(graph) == {"a": True}
+        assert calls == ["a"]
+
+    def test_coroutine_actions_share_one_event_loop(self):
+        loops = []
+
+        async def action():
+            loops.append(asyncio.get_running_loop())
+            await asyncio.sleep(0)
+
+        context = {"a": action, "b": action, "c": action}
+        graph = _graph(
+            context,
+            [("start", "a"), ("start", "b"), ("a", "c"), ("b", "c"), ("c", "end")],
+        )
+
+        Executor().execute(graph)
+
+        assert len(loops) == 3 and len(set(loops)) == 1
+
+    def test_actions_run_one_at_a_time_by_default(self):
+        running = []
+        overlaps = []
+
+        def action():
+            running.append(True)
+            overlaps.append(len(running) > 1)
+            running.pop()
+
+        context = {"a": action, "b": action}
+        graph = _graph(context, [("start", "a"), ("start", "b"), ("a", "end"), ("b", "end")])
+
+        Executor().execute(graph)
+
+        assert overlaps == [False, False]
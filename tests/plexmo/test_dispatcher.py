@@ -15,20 +15,23 @@
 # Authors:
 # - Sebastian Stock, DFKI
 # - Selvakumar H S, LAAS-CNRS
-import pytest
+import os
+
+import networkx as nx
 from unified_planning.plans.plan import ActionInstance
 
-from tests import ContextManager, get_example_plans
-from up_esb.bridge import Bridge
 from up_esb.plexmo.dispatcher import PlanDispatcher
 from up_esb.status import ActionNodeStatus, DispatcherStatus, MonitorStatus
 
 # pylint: disable=all
 
+_VERBOSE = bool(os.environ.get("ESB_VERBOSE"))
+
 
 class TestDispatcher:
     def suceeding_execute_cb(self, action: ActionInstance) -> bool:
-        print("In callback. Action: %s" % action.action.name)
+        if _VERBOSE:
+            print("In callback. Action: %s" % action.action.name)
         self._dispatched_action = action
         return True
 
@@ -37,14 +40,8 @@ class TestDispatcher:
         dispatcher.set_dispatch_callback(self.suceeding_execute_cb)
         assert dispatcher._dispatch_cb == self.suceeding_execute_cb
 
-    @pytest.mark.parametrize("plan_name, plan", get_example_plans().items())
-    def test_successfull_execution(self, plan_name, plan):
-        bridge = Bridge()
-        ContextManager.plan = plan
-        bridge._api_actions = ContextManager.get_actions_context(returns=True)
-        bridge._api_objects = ContextManager.get_objects_context()
-        bridge._fluent_functions = ContextManager.get_fluents_context()
-        graph = bridge.get_executable_graph(plan)
+    def test_successfull_execution(self, prepared_plan):
+        _, plan, _, graph = prepared_plan
 
         dispatcher = PlanDispatcher()
         dispatcher.execute_plan(plan, graph, verbose=True, dry_run=True)
@@ -54,3 +51,16 @@ class TestDispatcher:
         for _, node in dispatcher.monitor_graph.nodes(data=True):
             assert node["processed"] == True
             assert node["status"] == ActionNodeStatus.SUCCEEDED
+
+    def test_execution_follows_dependencies(self, prepared_plan):
+        _, plan, _, graph = prepared_plan
+
+        # Insert nodes in reverse order, so that node order differs from execution order
+        reversed_graph = nx.DiGraph()
+        reversed_graph.add_nodes_from(reversed(list(graph.nodes(data=True))))
+        reversed_graph.add_edges_from(graph.edges)
+
+        dispatcher = PlanDispatcher()
+        dispatcher.execute_plan(plan, reversed_graph, verbose=True, dry_run=True)
+        assert dispatcher.status == DispatcherStatus.FINISHED
+        assert dispatcher.monitor_status == MonitorStatus.FINISHED
@@ -12,15 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import warnings
+from functools import cached_property
+from itertools import chain
 from typing import Callable, Dict
 
 import pytest
-from unified_planning.shortcuts import Equals, Not, OneshotPlanner
+from unified_planning.plans import PlanKind
+from unified_planning.shortcuts import Equals, Not
 
-from tests import ContextManager, get_example_plans
+from tests import _get_example_problems, get_example_plans, prime_bridge
 from up_esb.bridge import Bridge
 from up_esb.components import ActionDefinition
 
+SKIP_ACTIONS = frozenset(("start", "end"))
+_EXAMPLE_PLANS = tuple(get_example_plans().items())
+
 # pylint: disable=all
 ############################################################################################################
 ######################################### ESSENTIALS #######################################################
@@ -28,6 +35,8 @@ from up_esb.components import ActionDefinition
 
 
 class Location:
+    __slots__ = ("name", "x", "y", "z", "yaw")
+
     def __init__(self, name, x, y, z, yaw):
         self.name = name
         self.x = x
@@ -40,6 +49,8 @@ class Location:
 
 
 class Area:
+    __slots__ = ("name", "xmin", "xmax", "ymin", "ymax", "z", "yaw")
+
     def __init__(self, name, xmin, xmax, ymin, ymax, z, yaw):
         self.name = name
         self.xmin = xmin
@@ -122,18 +133,35 @@ class Application:
     is_within_area = Fluents.is_within_area
 
     # Objects
-    l1 = Location("l1", x=3.5, y=3.5, z=1.0, yaw=0.0)
-    l2 = Location("l2", x=-2.5, y=1.5, z=1.0, yaw=0.0)
-    l3 = Location("l3", x=1.5, y=-2.5, z=1.0, yaw=0.0)
-    l4 = Location("l4", x=-1.5, y=-3.5, z=1.0, yaw=0.0)
-    home = Location("home", x=0.0, y=0.0, z=1.0, yaw=0.0)
-    area = Area("area", xmin=-4.0, xmax=4.0, ymin=-4.0, ymax=4.0, z=3.0, yaw=0.0)
+    @cached_property
+    def l1(self):
+        return Location("l1", x=3.5, y=3.5, z=1.0, yaw=0.0)
+
+    @cached_property
+    def l2(self):
+        return Location("l2", x=-2.5, y=1.5, z=1.0, yaw=0.0)
+
+    @cached_property
+    def l3(self):
+        return Location("l3", x=1.5, y=-2.5, z=1.0, yaw=0.0)
+
+    @cached_property
+    def l4(self):
+        return Location("l4", x=-1.5, y=-3.5, z=1.0, yaw=0.0)
+
+    @cached_property
+    def home(self):
+        return Location("home", x=0.0, y=0.0, z=1.0, yaw=0.0)
 
-    # Actions
-    move = Move
-    capture_photo = CapturePhoto
-    survey = Survey
-    gather_info = GatherInfo
+    @cached_property
+    def area(self):
+        return Area("area", xmin=-4.0, xmax=4.0, ymin=-4.0, ymax=4.0, z=3.0, yaw=0.0)
+
+    # Actions, created once and shared by every declaration
+    move = Move("Move")
+    capture_photo = CapturePhoto("CapturePhoto")
+    survey = Survey("Survey")
+    gather_info = GatherInfo("GatherInfo")
 
 
 ############################################################################################################
@@ -142,6 +170,27 @@ class Application:
 
 
 class ProblemDeclaration(Application):
+    # The robot starts at home, which is the only location already checked.
+    LOCATIONS = ("o_home", "o_l1", "o_l2", "o_l3", "o_l4")
+    # (fluent, object arguments, value) for every initial value of the problem.
+    INITIAL_VALUES = (("f_is_surveyed", ("o_area",), False),) + tuple(
+        initial_value
+        for location in LOCATIONS
+        for initial_value in (
+            ("f_robot_at", (location,), location == "o_home"),
+            ("f_verified_station_at", (location,), location == "o_home"),
+            ("f_is_within_area", ("o_area", location), True),
+            ("f_is_location_surveyed", ("o_area", location), location == "o_home"),
+        )
+    )
+    # (fluent, object arguments) for every goal of the problem.
+    GOALS = (
+        (("f_is_surveyed", ("o_area",)),)
+        + tuple(("f_is_location_surveyed", ("o_area", location)) for location in LOCATIONS[1:])
+        + tuple(("f_verified_station_at", (location,)) for location in LOCATIONS[1:])
+        + (("f_robot_at", ("o_home",)),)
+    )
+
     def get_parameterizer(self):
         """Get pytest parameterizer for test case."""
         # TODO: Add generatives
@@ -154,6 +203,27 @@ class ProblemDeclaration(Application):
             self.create_actions_from_signatures,
         ]
 
+    def problem_declarations(self):
+        """Vary one kind of declaration at a time instead of testing every combination."""
+        fluents, objects, actions = (
+            self.fluent_declarations[0],
+            self.object_declarations[0],
+            self.action_declarations[0],
+        )
+        declarations = [
+            (fluents, objects, dec_actions, self.declare_problem)
+            for dec_actions in self.action_declarations
+        ]
+        declarations += [
+            (dec_fluents, objects, actions, self.declare_problem)
+            for dec_fluents in self.fluent_declarations[1:]
+        ]
+        declarations += [
+            (fluents, dec_objects, actions, self.declare_problem)
+            for dec_objects in self.object_declarations[1:]
+        ]
+        return declarations
+
     def create_fluents_from_functions(self, bridge: Bridge):
         f_robot_at = bridge.create_fluent_from_function(ProblemDeclaration.robot_at)
         f_verified_station_at = bridge.create_fluent_from_function(
@@ -173,187 +243,101 @@ class ProblemDeclaration(Application):
             "f_is_within_area": f_is_within_area,
         }
 
-    def create_action_kwargs(self, bridge: Bridge, fluents):
-        """Actions with executable function."""
-        move, (a, l_from, l_to) = bridge.create_action(
-            "Move", _callable=self.move, area=Area, l_from=Location, l_to=Location
-        )
-        move.add_precondition(fluents["f_is_surveyed"](a))
-        move.add_precondition(fluents["f_is_location_surveyed"](a, l_to))
-        move.add_precondition(Not(Equals(l_from, l_to)))
-        move.add_precondition(fluents["f_robot_at"](l_from))
-        move.add_precondition(Not(fluents["f_robot_at"](l_to)))
-        move.add_effect(fluents["f_robot_at"](l_from), False)
-        move.add_effect(fluents["f_robot_at"](l_to), True)
+    def add_conditions(self, fluents, move, capture_photo, survey, gather_info):
+        """Add the preconditions and effects shared by every action declaration."""
+        f_robot_at, f_is_surveyed = fluents["f_robot_at"], fluents["f_is_surveyed"]
+        f_is_location_surveyed = fluents["f_is_location_surveyed"]
 
-        capture_photo, (a, l) = bridge.create_action(
-            "CapturePhoto", _callable=self.capture_photo, area=Area, l=Location
-        )
-        capture_photo.add_precondition(fluents["f_is_surveyed"](a))
-        capture_photo.add_precondition(fluents["f_is_location_surveyed"](a, l))
-        capture_photo.add_precondition(fluents["f_robot_at"](l))
+        move, (a, l_from, l_to) = move
+        move.add_precondition(f_is_surveyed(a))
+        move.add_precondition(f_is_location_surveyed(a, l_to))
+        move.add_precondition(Not(Equals(l_from, l_to)))
+        move.add_precondition(f_robot_at(l_from))
+        move.add_precondition(Not(f_robot_at(l_to)))
+        move.add_effect(f_robot_at(l_from), False)
+        move.add_effect(f_robot_at(l_to), True)
+
+        capture_photo, (a, l) = capture_photo
+        capture_photo.add_precondition(f_is_surveyed(a))
+        capture_photo.add_precondition(f_is_location_surveyed(a, l))
+        capture_photo.add_precondition(f_robot_at(l))
         capture_photo.add_effect(fluents["f_verified_station_at"](l), True)
-        capture_photo.add_effect(
-            fluents["f_robot_at"](l), True
-        )  # Since using instantaneous actions
+        capture_photo.add_effect(f_robot_at(l), True)  # Since using instantaneous actions
 
-        survey, [a] = bridge.create_action("Survey", _callable=self.survey, area=Area)
-        survey.add_precondition(Not(fluents["f_is_surveyed"](a)))
-        survey.add_effect(fluents["f_is_surveyed"](a), True)
+        survey, [a] = survey
+        survey.add_precondition(Not(f_is_surveyed(a)))
+        survey.add_effect(f_is_surveyed(a), True)
 
-        gather_info, (a, l) = bridge.create_action(
-            "GatherInfo", _callable=self.gather_info, area=Area, l=Location
-        )
-        gather_info.add_precondition(fluents["f_is_surveyed"](a))
+        gather_info, (a, l) = gather_info
+        gather_info.add_precondition(f_is_surveyed(a))
         gather_info.add_precondition(fluents["f_is_within_area"](a, l))
-        gather_info.add_effect(fluents["f_is_location_surveyed"](a, l), True)
+        gather_info.add_effect(f_is_location_surveyed(a, l), True)
+
+    def create_action_kwargs(self, bridge: Bridge, fluents):
+        """Actions with executable function."""
+        self.add_conditions(
+            fluents,
+            bridge.create_action(
+                "Move", _callable=self.move, area=Area, l_from=Location, l_to=Location
+            ),
+            bridge.create_action(
+                "CapturePhoto", _callable=self.capture_photo, area=Area, l=Location
+            ),
+            bridge.create_action("Survey", _callable=self.survey, area=Area),
+            bridge.create_action("GatherInfo", _callable=self.gather_info, area=Area, l=Location),
+        )
 
     def create_action_without_execution(self, bridge: Bridge, fluents):
         """Actions without execution."""
-        move, (a, l_from, l_to) = bridge.create_action(
-            "Move", area=Area, l_from=Location, l_to=Location
+        self.add_conditions(
+            fluents,
+            bridge.create_action("Move", area=Area, l_from=Location, l_to=Location),
+            bridge.create_action("CapturePhoto", area=Area, l=Location),
+            bridge.create_action("Survey", area=Area),
+            bridge.create_action("GatherInfo", area=Area, l=Location),
         )
-        move.add_precondition(fluents["f_is_surveyed"](a))
-        move.add_precondition(fluents["f_is_location_surveyed"](a, l_to))
-        move.add_precondition(Not(Equals(l_from, l_to)))
-        move.add_precondition(fluents["f_robot_at"](l_from))
-        move.add_precondition(Not(fluents["f_robot_at"](l_to)))
-        move.add_effect(fluents["f_robot_at"](l_from), False)
-        move.add_effect(fluents["f_robot_at"](l_to), True)
-
-        capture_photo, (a, l) = bridge.create_action("CapturePhoto", area=Area, l=Location)
-        capture_photo.add_precondition(fluents["f_is_surveyed"](a))
-        capture_photo.add_precondition(fluents["f_is_location_surveyed"](a, l))
-        capture_photo.add_precondition(fluents["f_robot_at"](l))
-        capture_photo.add_effect(fluents["f_verified_station_at"](l), True)
-        capture_photo.add_effect(
-            fluents["f_robot_at"](l), True
-        )  # Since using instantaneous actions
-
-        survey, [a] = bridge.create_action("Survey", area=Area)
-        survey.add_precondition(Not(fluents["f_is_surveyed"](a)))
-        survey.add_effect(fluents["f_is_surveyed"](a), True)
-
-        gather_info, (a, l) = bridge.create_action("GatherInfo", area=Area, l=Location)
-        gather_info.add_precondition(fluents["f_is_surveyed"](a))
-        gather_info.add_precondition(fluents["f_is_within_area"](a, l))
-        gather_info.add_effect(fluents["f_is_location_surveyed"](a, l), True)
 
     def create_actions_from_functions(self, bridge: Bridge, fluents):
         """Input type as class functions."""
-        move, (a, l_from, l_to) = bridge.create_action_from_function(function=Actions.move)
-        move.add_precondition(fluents["f_is_surveyed"](a))
-        move.add_precondition(fluents["f_is_location_surveyed"](a, l_to))
-        move.add_precondition(Not(Equals(l_from, l_to)))
-        move.add_precondition(fluents["f_robot_at"](l_from))
-        move.add_precondition(Not(fluents["f_robot_at"](l_to)))
-        move.add_effect(fluents["f_robot_at"](l_from), False)
-        move.add_effect(fluents["f_robot_at"](l_to), True)
-
-        capture_photo, (a, l) = bridge.create_action_from_function(function=Actions.capture_photo)
-        capture_photo.add_precondition(fluents["f_is_surveyed"](a))
-        capture_photo.add_precondition(fluents["f_is_location_surveyed"](a, l))
-        capture_photo.add_precondition(fluents["f_robot_at"](l))
-        capture_photo.add_effect(fluents["f_verified_station_at"](l), True)
-        capture_photo.add_effect(
-            fluents["f_robot_at"](l), True
-        )  # Since using instantaneous actions
-
-        survey, [a] = bridge.create_action_from_function(function=Actions.survey)
-        survey.add_precondition(Not(fluents["f_is_surveyed"](a)))
-        survey.add_effect(fluents["f_is_surveyed"](a), True)
-
-        gather_info, (a, l) = bridge.create_action_from_function(function=Actions.gather_info)
-        gather_info.add_precondition(fluents["f_is_surveyed"](a))
-        gather_info.add_precondition(fluents["f_is_within_area"](a, l))
-        gather_info.add_effect(fluents["f_is_location_surveyed"](a, l), True)
+        self.add_conditions(
+            fluents,
+            bridge.create_action_from_function(function=Actions.move),
+            bridge.create_action_from_function(function=Actions.capture_photo),
+            bridge.create_action_from_function(function=Actions.survey),
+            bridge.create_action_from_function(function=Actions.gather_info),
+        )
 
     def create_actions_from_methods(self, bridge: Bridge, fluents):
         """Input types as class methods."""
-        move, (a, l_from, l_to) = bridge.create_action_from_method(method=self.move.__call__)
-        move.add_precondition(fluents["f_is_surveyed"](a))
-        move.add_precondition(fluents["f_is_location_surveyed"](a, l_to))
-        move.add_precondition(Not(Equals(l_from, l_to)))
-        move.add_precondition(fluents["f_robot_at"](l_from))
-        move.add_precondition(Not(fluents["f_robot_at"](l_to)))
-        move.add_effect(fluents["f_robot_at"](l_from), False)
-        move.add_effect(fluents["f_robot_at"](l_to), True)
-
-        capture_photo, (a, l) = bridge.create_action_from_function(
-            name="CapturePhoto", function=self.capture_photo.__call__
+        self.add_conditions(
+            fluents,
+            bridge.create_action_from_method(method=self.move.__call__),
+            bridge.create_action_from_function(
+                name="CapturePhoto", function=self.capture_photo.__call__
+            ),
+            bridge.create_action_from_function(name="Survey", function=self.survey.__call__),
+            bridge.create_action_from_function(
+                name="GatherInfo", function=self.gather_info.__call__
+            ),
         )
-        capture_photo.add_precondition(fluents["f_is_surveyed"](a))
-        capture_photo.add_precondition(fluents["f_is_location_surveyed"](a, l))
-        capture_photo.add_precondition(fluents["f_robot_at"](l))
-        capture_photo.add_effect(fluents["f_verified_station_at"](l), True)
-        capture_photo.add_effect(
-            fluents["f_robot_at"](l), True
-        )  # Since using instantaneous actions
-
-        survey, [a] = bridge.create_action_from_function(
-            name="Survey", function=self.survey.__call__
-        )
-        survey.add_precondition(Not(fluents["f_is_surveyed"](a)))
-        survey.add_effect(fluents["f_is_surveyed"](a), True)
-
-        gather_info, (a, l) = bridge.create_action_from_function(
-            name="GatherInfo", function=self.gather_info.__call__
-        )
-        gather_info.add_precondition(fluents["f_is_surveyed"](a))
-        gather_info.add_precondition(fluents["f_is_within_area"](a, l))
-        gather_info.add_effect(fluents["f_is_location_surveyed"](a, l), True)
 
     def create_actions_from_signatures(self, bridge: Bridge, fluents):
         """Input type as dict."""
-        move, (a, l_from, l_to) = bridge.create_action(
-            "Move", signature={"area": Area, "l_from": Location, "l_to": Location}
-        )
-        move.add_precondition(fluents["f_is_surveyed"](a))
-        move.add_precondition(fluents["f_is_location_surveyed"](a, l_to))
-        move.add_precondition(Not(Equals(l_from, l_to)))
-        move.add_precondition(fluents["f_robot_at"](l_from))
-        move.add_precondition(Not(fluents["f_robot_at"](l_to)))
-        move.add_effect(fluents["f_robot_at"](l_from), False)
-        move.add_effect(fluents["f_robot_at"](l_to), True)
-
-        capture_photo, (a, l) = bridge.create_action(
-            "CapturePhoto", signature={"area": Area, "l": Location}
-        )
-        capture_photo.add_precondition(fluents["f_is_surveyed"](a))
-        capture_photo.add_precondition(fluents["f_is_location_surveyed"](a, l))
-        capture_photo.add_precondition(fluents["f_robot_at"](l))
-        capture_photo.add_effect(fluents["f_verified_station_at"](l), True)
-        capture_photo.add_effect(
-            fluents["f_robot_at"](l), True
-        )  # Since using instantaneous actions
-
-        survey, [a] = bridge.create_action("Survey", signature={"area": Area})
-        survey.add_precondition(Not(fluents["f_is_surveyed"](a)))
-        survey.add_effect(fluents["f_is_surveyed"](a), True)
-
-        gather_info, (a, l) = bridge.create_action(
-            "GatherInfo", signature={"area": Area, "l": Location}
+        self.add_conditions(
+            fluents,
+            bridge.create_action(
+                "Move", signature={"area": Area, "l_from": Location, "l_to": Location}
+            ),
+            bridge.create_action("CapturePhoto", signature={"area": Area, "l": Location}),
+            bridge.create_action("Survey", signature={"area": Area}),
+            bridge.create_action("GatherInfo", signature={"area": Area, "l": Location}),
         )
-        gather_info.add_precondition(fluents["f_is_surveyed"](a))
-        gather_info.add_precondition(fluents["f_is_within_area"](a, l))
-        gather_info.add_effect(fluents["f_is_location_surveyed"](a, l), True)
 
     def create_objects(self, bridge: Bridge):
-        o_l1 = bridge.create_object(str(self.l1), self.l1)
-        o_l2 = bridge.create_object(str(self.l2), self.l2)
-        o_l3 = bridge.create_object(str(self.l3), self.l3)
-        o_l4 = bridge.create_object(str(self.l4), self.l4)
-        o_home = bridge.create_object(str(self.home), self.home)
-        o_area = bridge.create_object(str(self.area), self.area)
+        api_objects = (self.l1, self.l2, self.l3, self.l4, self.home, self.area)
+        up_objects = bridge.create_objects({obj.name: obj for obj in api_objects})
 
-        return {
-            "o_l1": o_l1,
-            "o_l2": o_l2,
-            "o_l3": o_l3,
-            "o_l4": o_l4,
-            "o_home": o_home,
-            "o_area": o_area,
-        }
+        return {f"o_{up_object.name}": up_object for up_object in up_objects}
 
     def declare_problem(
         self,
@@ -369,61 +353,16 @@ class ProblemDeclaration(Application):
         actions = dec_actions(bridge, fluents)
 
         problem = bridge.define_problem()
-        problem.set_initial_value(fluents["f_robot_at"](objects["o_home"]), True)
-        problem.set_initial_value(fluents["f_robot_at"](objects["o_l1"]), False)
-        problem.set_initial_value(fluents["f_robot_at"](objects["o_l2"]), False)
-        problem.set_initial_value(fluents["f_robot_at"](objects["o_l3"]), False)
-        problem.set_initial_value(fluents["f_robot_at"](objects["o_l4"]), False)
-
-        problem.set_initial_value(fluents["f_verified_station_at"](objects["o_home"]), True)
-        problem.set_initial_value(fluents["f_verified_station_at"](objects["o_l1"]), False)
-        problem.set_initial_value(fluents["f_verified_station_at"](objects["o_l2"]), False)
-        problem.set_initial_value(fluents["f_verified_station_at"](objects["o_l3"]), False)
-        problem.set_initial_value(fluents["f_verified_station_at"](objects["o_l4"]), False)
-
-        problem.set_initial_value(fluents["f_is_surveyed"](objects["o_area"]), False)
-        problem.set_initial_value(
-            fluents["f_is_within_area"](objects["o_area"], objects["o_home"]), True
-        )
-        problem.set_initial_value(
-            fluents["f_is_within_area"](objects["o_area"], objects["o_l1"]), True
-        )
-        problem.set_initial_value(
-            fluents["f_is_within_area"](objects["o_area"], objects["o_l2"]), True
-        )
-        problem.set_initial_value(
-            fluents["f_is_within_area"](objects["o_area"], objects["o_l3"]), True
-        )
-        problem.set_initial_value(
-            fluents["f_is_within_area"](objects["o_area"], objects["o_l4"]), True
-        )
-        problem.set_initial_value(
-            fluents["f_is_location_surveyed"](objects["o_area"], objects["o_home"]),
-            True,
-        )
-        problem.set_initial_value(
-            fluents["f_is_location_surveyed"](objects["o_area"], objects["o_l1"]), False
-        )
-        problem.set_initial_value(
-            fluents["f_is_location_surveyed"](objects["o_area"], objects["o_l2"]), False
-        )
-        problem.set_initial_value(
-            fluents["f_is_location_surveyed"](objects["o_area"], objects["o_l3"]), False
-        )
-        problem.set_initial_value(
-            fluents["f_is_location_surveyed"](objects["o_area"], objects["o_l4"]), False
+        bridge.set_initial_values(
+            problem,
+            {
+                fluents[fluent](*(objects[name] for name in args)): value
+                for fluent, args, value in self.INITIAL_VALUES
+            },
         )
 
-        problem.add_goal(fluents["f_is_surveyed"](objects["o_area"]))
-        problem.add_goal(fluents["f_is_location_surveyed"](objects["o_area"], objects["o_l1"]))
-        problem.add_goal(fluents["f_is_location_surveyed"](objects["o_area"], objects["o_l2"]))
-        problem.add_goal(fluents["f_is_location_surveyed"](objects["o_area"], objects["o_l3"]))
-        problem.add_goal(fluents["f_is_location_surveyed"](objects["o_area"], objects["o_l4"]))
-        problem.add_goal(fluents["f_verified_station_at"](objects["o_l1"]))
-        problem.add_goal(fluents["f_verified_station_at"](objects["o_l2"]))
-        problem.add_goal(fluents["f_verified_station_at"](objects["o_l3"]))
-        problem.add_goal(fluents["f_verified_station_at"](objects["o_l4"]))
-        problem.add_goal(fluents["f_robot_at"](objects["o_home"]))
+        for fluent, args in self.GOALS:
+            problem.add_goal(fluents[fluent](*(objects[name] for name in args)))
 
         return problem
 
@@ -435,122 +374,179 @@ problem = ProblemDeclaration()
 problem.get_parameterizer()
 
 
+def _action_nodes(graph):
+    """Data of the graph's current action nodes, leaving out the start and end nodes."""
+    return [node for _, node in graph.nodes(data=True) if node["action"] not in SKIP_ACTIONS]
+
+
+@pytest.fixture
+def bridge() -> Bridge:
+    """Bridge with the application types declared."""
+    bridge = Bridge()
+    bridge.create_types([Location, Area])
+    return bridge
+
+
+@pytest.fixture(scope="module")
+def declared_actions(request):
+    """Typed bridge with the given fluent and action declarations, built once per module."""
+    dec_fluents, dec_actions = request.param
+    bridge = Bridge()
+    bridge.create_types([Location, Area])
+    fluents = dec_fluents(bridge)
+    dec_actions(bridge, fluents)
+    return bridge, fluents
+
+
 class TestBridge:
     def test_bridge_setup(self) -> None:
         self.bridge = Bridge()
 
     @pytest.mark.parametrize("dec_fluents", problem.fluent_declarations)
-    def test_fluents(self, dec_fluents) -> None:
-        bridge = Bridge()
-        bridge.create_types([Location, Area])
-
+    def test_fluents(self, bridge, dec_fluents) -> None:
         fluents = dec_fluents(bridge)
 
-    @pytest.mark.parametrize("dec_objects", problem.object_declarations)
-    def test_objects(self, dec_objects) -> None:
+    def test_signature_cache(self) -> None:
+        bridge = Bridge()
+        assert bridge.get_name_and_signature(Location.__repr__) == ("__repr__", {"return": str})
+        bridge.create_types([Location])
+        name, signature = bridge.get_name_and_signature(Location.__repr__)
+        assert list(signature) == ["Location", "return"]
+        signature.clear()
+        assert bridge.get_name_and_signature(Location.__repr__)[1]
+
+    def test_type_cache(self) -> None:
         bridge = Bridge()
-        bridge.create_types([Location, Area])
+        assert bridge.get_type(int).upper_bound == 100
+        bridge.int_bounds = (0, 10)
+        assert bridge.get_object_type(5).upper_bound == 10
+        with pytest.raises(ValueError):
+            bridge.get_type(Location)
+        bridge.create_types([Location])
+        assert bridge.get_object_type(Location("l", 0, 0, 0, 0)).name == "Location"
 
+    @pytest.mark.parametrize("dec_objects", problem.object_declarations)
+    def test_objects(self, bridge, dec_objects) -> None:
         objects = dec_objects(bridge)
 
-    @pytest.mark.parametrize("dec_fluents", problem.fluent_declarations)
-    @pytest.mark.parametrize("dec_actions", problem.action_declarations)
-    def test_actions(self, dec_fluents, dec_actions) -> None:
-        bridge = Bridge()
-        bridge.create_types([Location, Area])
+    @pytest.mark.parametrize(
+        "declared_actions",
+        [
+            (dec_fluents, dec_actions)
+            for dec_fluents in problem.fluent_declarations
+            for dec_actions in problem.action_declarations
+        ],
+        ids=lambda declarations: "-".join(d.__name__ for d in declarations),
+        indirect=True,
+    )
+    def test_actions(self, declared_actions) -> None:
+        bridge, _ = declared_actions
+        assert len(bridge._actions) == 4
+
+    @pytest.mark.parametrize(
+        "dec_fluents, dec_objects, dec_actions, dec_problem",
+        problem.problem_declarations(),
+        ids=lambda declaration: declaration.__name__,
+    )
+    def test_problem(
+        self, bridge, oneshot_planner, dec_fluents, dec_objects, dec_actions, dec_problem
+    ) -> None:
+        problem = dec_problem(bridge, dec_fluents, dec_objects, dec_actions)
 
-        fluents = dec_fluents(bridge)
-        actions = dec_actions(bridge, fluents)
+        result = oneshot_planner(problem.kind).solve(problem)
+        if result is None:
+            raise Exception("No solution found")
 
-    @pytest.mark.parametrize("dec_fluents", problem.fluent_declarations)
-    @pytest.mark.parametrize("dec_objects", problem.object_declarations)
-    @pytest.mark.parametrize("dec_actions", problem.action_declarations)
-    @pytest.mark.parametrize("dec_problem", [problem.declare_problem])
-    def test_problem(self, dec_fluents, dec_objects, dec_actions, dec_problem) -> None:
-        bridge = Bridge()
-        bridge.create_types([Location, Area])
+        print("*** Result ***")
+        for action_instance in result.plan.actions:
+            print(action_instance)
+        print("*** End of result ***")
 
-        problem = dec_problem(bridge, dec_fluents, dec_objects, dec_actions)
+    def test_set_initial_values_from_mapping(self, bridge) -> None:
+        fluents = problem.create_fluents_from_functions(bridge)
+        objects = problem.create_objects(bridge)
+        up_problem = bridge.define_problem()
 
-        with OneshotPlanner(problem_kind=problem.kind) as planner:
-            result = planner.solve(problem)
+        values = {
+            fluents["f_robot_at"](objects["o_home"]): True,
+            fluents["f_robot_at"](objects["o_l1"]): False,
+        }
+        bridge.set_initial_values(up_problem, values)
+
+        for fluent_expression, value in values.items():
+            assert up_problem.initial_value(fluent_expression).bool_constant_value() is value
 
-            if result is None:
-                raise Exception("No solution found")
+    def test_solve_reuses_planner(self, bridge) -> None:
+        up_problem = problem.declare_problem(
+            bridge,
+            problem.create_fluents_from_functions,
+            problem.create_objects,
+            problem.create_actions_from_signatures,
+        )
 
-            print("*** Result ***")
-            for action_instance in result.plan.actions:
-                print(action_instance)
-            print("*** End of result ***")
+        solve_options = {"optimize_with_default_metric": False}
+        with bridge:
+            assert bridge.solve(up_problem, **solve_options) is not None
+            planners = dict(bridge._planners)
+            assert bridge.solve(up_problem, **solve_options) is not None
+            assert bridge._planners == planners and len(planners) == 1
+        assert not bridge._planners
 
 
 class TestBridgeExecutableGraph:
-    @pytest.mark.parametrize("plan_name, plan", get_example_plans().items())
+    @pytest.mark.parametrize("plan_name, plan", _EXAMPLE_PLANS)
     def test_bridge_executable_graph(self, plan_name, plan):
-        bridge = Bridge()
-        ContextManager.plan = plan
-
-        bridge._api_actions = ContextManager.get_actions_context()
-        bridge._fluent_functions = ContextManager.get_fluents_context()
-        bridge._api_objects = ContextManager.get_objects_context()
+        bridge = prime_bridge(Bridge(), plan)
 
         bridge.get_executable_graph(plan)
 
-    @pytest.mark.parametrize("plan_name, plan", get_example_plans().items())
-    def test_bridge_executable_action(self, plan_name, plan):
-        bridge = Bridge()
-        ContextManager.plan = plan
-
-        bridge._api_actions = ContextManager.get_actions_context()
-        bridge._fluent_functions = ContextManager.get_fluents_context()
-        bridge._api_objects = ContextManager.get_objects_context()
+    @pytest.mark.parametrize("plan_name, plan", _EXAMPLE_PLANS)
+    def test_bridge_executable_graph_independent(self, plan_name, plan):
+        bridge = prime_bridge(Bridge(), plan)
 
         graph = bridge.get_executable_graph(plan)
-
-        for _, node in graph.nodes(data=True):
-            if node["action"] in ["start", "end"]:
-                continue
-
+        expected = {node["node_name"]: dict(node["parameters"]) for node in _action_nodes(graph)}
+        for node in _action_nodes(graph):
+            node["parameters"].clear()
+            node["context"].clear()
+
+        for node in _action_nodes(bridge.get_executable_graph(plan)):
+            assert node["parameters"] == expected[node["node_name"]]
+            assert node["action"] in node["context"]
+
+    def test_bridge_executable_graph_partial_order_plan(self):
+        example = _get_example_problems()["robot_fluent_of_user_type"]
+        plan = example.valid_plans[-1]
+        bridge = prime_bridge(Bridge(), plan)
+
+        # Plans are never compared or hashed, which fails or warns for partial order plans.
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            for _ in range(2):
+                pop = plan.convert_to(PlanKind.PARTIAL_ORDER_PLAN, example.problem)
+                bridge.get_executable_graph(pop)
+                bridge.get_executable_graph(pop)
+
+    def test_bridge_executable_action(self, prepared_plan):
+        _, _, _, graph = prepared_plan
+
+        for node in _action_nodes(graph):
             node["context"][node["action"]](**node["parameters"])
 
-    @pytest.mark.parametrize("plan_name, plan", get_example_plans().items())
-    def test_bridge_executable_preconditions(self, plan_name, plan):
-        bridge = Bridge()
-        ContextManager.plan = plan
-
-        bridge._api_actions = ContextManager.get_actions_context()
-        bridge._fluent_functions = ContextManager.get_fluents_context()
-        bridge._api_objects = ContextManager.get_objects_context()
-
-        graph = bridge.get_executable_graph(plan)
+    def test_bridge_executable_preconditions(self, prepared_plan, request):
+        _, _, _, graph = prepared_plan
+        verbose = request.config.getoption("verbose") > 0
 
-        for _, node in graph.nodes(data=True):
-            if node["action"] in ["start", "end"]:
-                continue
-            print(node["node_name"])
+        for node in _action_nodes(graph):
+            if verbose:
+                print(node["node_name"])
 
-            import ast
-
-            for preconditions in node["preconditions"].values():
-                for expression in preconditions:
-                    print(ast.dump(ast.parse(expression)))
-                    eval(compile(expression, "<ast>", "eval"), node["context"])
-
-    @pytest.mark.parametrize("plan_name, plan", get_example_plans().items())
-    def test_bridge_executable_postconditions(self, plan_name, plan):
-        bridge = Bridge()
-        ContextManager.plan = plan
-
-        bridge._api_actions = ContextManager.get_actions_context()
-        bridge._fluent_functions = ContextManager.get_fluents_context()
-        bridge._api_objects = ContextManager.get_objects_context()
-
-        graph = bridge.get_executable_graph(plan)
+            for condition in chain.from_iterable(node["preconditions"].values()):
+                eval(condition, node["context"])
 
-        for _, node in graph.nodes(data=True):
-            if node["action"] in ["start", "end"]:
-                continue
+    def test_bridge_executable_postconditions(self, prepared_plan):
+        _, _, _, graph = prepared_plan
 
-            for post_conditions in node["postconditions"].values():
-                for expression, _ in post_conditions:
-                    eval(compile(expression, "<ast>", "eval"), node["context"])
+        for node in _action_nodes(graph):
+            for condition, _ in chain.from_iterable(node["postconditions"].values()):
+                eval(condition, node["context"])
@@ -3,15 +3,21 @@
 Examples for different ways to define actions on the application side and how to use the up_esb
  to create UP representations from them.
 """
+import os
 from enum import Enum
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 import unified_planning as up
-from unified_planning.model import Problem
-from unified_planning.shortcuts import Not, OneshotPlanner
+from unified_planning.engines import Engine
+from unified_planning.model import Problem, ProblemKind
+from unified_planning.plans import Plan
+from unified_planning.shortcuts import And, Not, OneshotPlanner
 
 from up_esb import Bridge
 
+# Print the executed actions only on request, e.g. when running this file as an example.
+_VERBOSE = bool(os.environ.get("ESB_VERBOSE"))
+
 
 class Location(Enum):
     """Location enum for the bridge example."""
@@ -24,6 +30,8 @@ class Location(Enum):
 class Item:
     """Item class for the bridge example."""
 
+    __slots__ = ("name", "location")
+
     def __init__(self, name: str) -> None:
         self.name = name
         self.location: Optional[Location] = Location.A
@@ -33,12 +41,14 @@ class Item:
 
     def item_at(self, location: Location) -> bool:
         """Return True if the item is at the given location."""
-        return location == self.location
+        return location is self.location
 
 
 class Robot:
     """Robot class for the bridge example."""
 
+    __slots__ = ("name", "location", "item")
+
     def __init__(self, name: str, location: Location) -> None:
         self.name = name
         self.location = location
@@ -49,25 +59,26 @@ class Robot:
 
     def robot_at(self, location: Location) -> bool:
         """Return True if the robot is at the given location."""
-        return location == self.location
+        return location is self.location
 
     def robot_has(self, item: Item) -> bool:
         """Return True if the robot has the given item."""
-        return item == self.item
+        return item is self.item
 
     def move(self, location_from: Location, location_to: Location) -> None:
         """Move the robot from location_from to location_to."""
         self.location = location_to
-        print(f"{self} moves from {location_from} to {location_to}.")
+        if _VERBOSE:
+            print(f"{self} moves from {location_from} to {location_to}.")
 
 
 def place_item_onto_robot(robot: Robot, item: Item, location: Location) -> None:
     """Place item onto robot at location."""
-    assert robot.location == item.location == location
-    assert robot.item is None
+    assert (robot.location, item.location, robot.item) == (location, location, None)
     robot.item = item
     item.location = None
-    print(f"{item} is placed on {robot} at {location}.")
+    if _VERBOSE:
+        print(f"{item} is placed on {robot} at {location}.")
 
 
 class ActionDefinition:
@@ -79,11 +90,31 @@ class PassItemAction(ActionDefinition):
 
     def __call__(self, robot_from: Robot, robot_to: Robot, item: Item) -> None:
         """Let robot_from pass item to robot_to."""
-        assert robot_from.item == item
-        assert robot_to.item is None
+        assert (robot_from.item, robot_to.item) == (item, None)
         robot_from.item = None
         robot_to.item = item
-        print(f"{robot_from} passes {item} to {robot_to}.")
+        if _VERBOSE:
+            print(f"{robot_from} passes {item} to {robot_to}.")
+
+
+# Plans found so far, keyed on the printed problem.
+_PLAN_CACHE: Dict[str, Plan] = {}
+
+
+def _solve_cached(
+    problem: Problem, get_planner: Optional[Callable[[ProblemKind], Engine]] = None
+) -> Plan:
+    """Solve the problem, reusing the plan of an identical problem solved before."""
+    key = str(problem)
+    plan = _PLAN_CACHE.get(key)
+    if plan is None:
+        if get_planner is None:
+            with OneshotPlanner(problem_kind=problem.kind) as planner:
+                plan = planner.solve(problem).plan
+        else:
+            plan = get_planner(problem.kind).solve(problem).plan
+        _PLAN_CACHE[key] = plan
+    return plan
 
 
 class ActionDefinitionsExample(Bridge):
@@ -95,11 +126,11 @@ class ActionDefinitionsExample(Bridge):
         self.A, self.B, self.C = self.locations = self.create_enum_objects(Location)
         self.api_tool = Item("tool")
         self.tool = self.create_object("tool", self.api_tool)
-        self.items = [self.tool]
+        self.items = (self.tool,)
         self.api_robot1 = Robot("robot1", Location.A)
         self.api_robot2 = Robot("robot2", Location.B)
-        self.robot1, self.robot2 = self.robots = self.create_objects(
-            robot1=self.api_robot1, robot2=self.api_robot2
+        self.robot1, self.robot2 = self.robots = tuple(
+            self.create_objects(robot1=self.api_robot1, robot2=self.api_robot2)
         )
         self.item_at = self.create_fluent_from_function(Item.item_at)
         self.robot_at = self.create_fluent_from_function(Robot.robot_at)
@@ -123,8 +154,9 @@ class ActionDefinitionsExample(Bridge):
         # self.move, (robot, location_from, location_to) = self.create_action_from_function(Robot.move) # pylint: disable=line-too-long
         # self.move, (robot, location_from, location_to) = self.create_action("move", callable=Robot.move, robot=Robot, location_from=Location, location_to=Location) # pylint: disable=line-too-long
         self.move.add_precondition(self.robot_at(robot, location_from))
-        for check_robot in self.robots:
-            self.move.add_precondition(Not(self.robot_at(check_robot, location_to)))
+        self._mutex(
+            self.move, lambda check_robot: self.robot_at(check_robot, location_to), self.robots
+        )
         self.move.add_effect(self.robot_at(robot, location_from), False)
         self.move.add_effect(self.robot_at(robot, location_to), True)
 
@@ -139,8 +171,7 @@ class ActionDefinitionsExample(Bridge):
         # self.place, (robot, item, location) = self.create_action("place", callable=place_item_onto_robot, robot=Robot, item=Item, location=Location) # pylint: disable=line-too-long
         self.place.add_precondition(self.item_at(item, location))
         self.place.add_precondition(self.robot_at(robot, location))
-        for check_item in self.items:
-            self.place.add_precondition(Not(self.robot_has(check_robot, item)))
+        self._mutex(self.place, lambda check_item: self.robot_has(robot, check_item), self.items)
         self.place.add_effect(self.item_at(item, location), False)
         self.place.add_effect(self.robot_has(robot, item), True)
 
@@ -154,13 +185,19 @@ class ActionDefinitionsExample(Bridge):
         #     callable=PassItemAction(), robot_from=Robot, robot_to=Robot, item=Item)
         # As before, providing the callable PassItemAction() can be done later than at action declaration.
         self.pass_item.add_precondition(self.robot_has(robot_from, item))
-        for check_item in self.items:
-            self.pass_item.add_precondition(Not(self.robot_has(robot_to, check_item)))
+        self._mutex(
+            self.pass_item, lambda check_item: self.robot_has(robot_to, check_item), self.items
+        )
         self.pass_item.add_effect(self.robot_has(robot_from, item), False)
         self.pass_item.add_effect(self.robot_has(robot_to, item), True)
 
-    def test(self) -> None:
-        """Test the problem."""
+    @staticmethod
+    def _mutex(action, condition, others) -> None:
+        """Add a precondition to action that condition holds for none of others."""
+        action.add_precondition(And(Not(condition(other)) for other in others))
+
+    def test(self, get_planner: Optional[Callable[[ProblemKind], Engine]] = None) -> None:
+        """Test the problem, optionally getting the planner for its kind from get_planner."""
         problem = Problem()
         problem.add_objects(self.locations)
         problem.add_object(self.tool)
@@ -175,20 +212,19 @@ class ActionDefinitionsExample(Bridge):
 
         problem.add_goal(self.robot_has(self.robot2, self.tool))
         problem.add_goal(self.robot_at(self.robot2, self.C))
-        with OneshotPlanner(problem_kind=problem.kind) as planner:
-            result = planner.solve(problem)
-            for action in result.plan.actions:
-                _callable, parameters = self.get_executable_action(action)
-                _callable(*parameters)
-        assert self.api_robot2.robot_has(self.api_tool)
-        assert self.api_robot2.robot_at(Location.C)
+        for action in _solve_cached(problem, get_planner).actions:
+            _callable, parameters = self.get_executable_action(action)
+            _callable(*parameters)
+        assert self.api_robot2.item is self.api_tool
+        assert self.api_robot2.location is Location.C
 
 
-def test_create_action() -> None:
+def test_create_action(oneshot_planner) -> None:
     """Test the create_action() method.""" ""
-    up.shortcuts.get_environment().credits_stream = None
-    ActionDefinitionsExample().test()
+    ActionDefinitionsExample().test(oneshot_planner)
 
 
 if __name__ == "__main__":
-    test_create_action()
+    _VERBOSE = True
+    up.shortcuts.get_environment().credits_stream = None
+    ActionDefinitionsExample().test()
@@ -12,102 +12,78 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from enum import Enum
+
 import pytest
 
 from up_esb.exceptions import *  # pylint: disable=unused-wildcard-import
 from up_esb.execution import ActionResult
 from up_esb.status import ActionNodeStatus, ConditionStatus
 
-expected_precondition_exceptions = [
-    (ActionResult(ConditionStatus.FAILED, None, None, "Test exception"), PreconditionsNotMet),
-    (ActionResult(ConditionStatus.TIMEOUT, None, None, "Test exception"), PreconditionsTimeout),
-    (ActionResult(ConditionStatus.SKIPPED, None, None, "Test exception"), PreconditionWarn),
-    (
-        ActionResult(
-            ConditionStatus.NOT_STARTED, ActionNodeStatus.NOT_STARTED, None, "Test exception"
-        ),
-        PreconditionError,
-    ),
-    (ActionResult(ConditionStatus.SUCCEEDED, None, None, "Test exception"), AssertionError),
-]
-
-expected_action_exceptions = [
-    (ActionResult(None, ActionNodeStatus.FAILED, None, "Test exception"), AssertionError),
-    (
-        ActionResult(ConditionStatus.SUCCEEDED, ActionNodeStatus.TIMEOUT, None, "Test exception"),
-        ActionTimeout,
-    ),
-    (
-        ActionResult(ConditionStatus.SUCCEEDED, ActionNodeStatus.SKIPPED, None, "Test exception"),
-        ActionWarn,
-    ),
-    (
-        ActionResult(ConditionStatus.FAILED, ActionNodeStatus.NOT_STARTED, None, "Test exception"),
-        PreconditionsNotMet,
-    ),
-]
-
-expected_postcondition_exceptions = [
-    (
-        ActionResult(ConditionStatus.SUCCEEDED, ActionNodeStatus.SUCCEEDED, None, "Test exception"),
-        AssertionError,
-    ),
-    (
-        ActionResult(
-            ConditionStatus.SUCCEEDED,
-            ActionNodeStatus.SUCCEEDED,
-            ConditionStatus.FAILED,
-            "Test exception",
-        ),
-        PostconditionNotMet,
-    ),
-    (
-        ActionResult(
-            ConditionStatus.SUCCEEDED,
-            ActionNodeStatus.SUCCEEDED,
-            ConditionStatus.SKIPPED,
-            "Test exception",
-        ),
-        PostconditionWarn,
-    ),
-    (
-        ActionResult(
-            ConditionStatus.SUCCEEDED,
-            ActionNodeStatus.SUCCEEDED,
-            ConditionStatus.TIMEOUT,
-            "Test exception",
-        ),
-        PostconditionTimeout,
-    ),
-    (
-        ActionResult(
-            ConditionStatus.FAILED,
-            ActionNodeStatus.SUCCEEDED,
-            ConditionStatus.SUCCEEDED,
-            "Test exception",
-        ),
-        PreconditionsNotMet,
-    ),
-]
+_MSG = "Test exception"
+_PARAMETERS = "precondition_status, action_status, postcondition_status, exception"
+
+_FAILED, _SUCCEEDED = ConditionStatus.FAILED, ConditionStatus.SUCCEEDED
+_ACTION_SUCCEEDED = ActionNodeStatus.SUCCEEDED
+
+expected_precondition_exceptions = (
+    (_FAILED, None, None, PreconditionsNotMet),
+    (ConditionStatus.TIMEOUT, None, None, PreconditionsTimeout),
+    (ConditionStatus.SKIPPED, None, None, PreconditionWarn),
+    (ConditionStatus.NOT_STARTED, ActionNodeStatus.NOT_STARTED, None, PreconditionError),
+    (_SUCCEEDED, None, None, AssertionError),
+)
+
+expected_action_exceptions = (
+    (None, ActionNodeStatus.FAILED, None, AssertionError),
+    (_SUCCEEDED, ActionNodeStatus.TIMEOUT, None, ActionTimeout),
+    (_SUCCEEDED, ActionNodeStatus.SKIPPED, None, ActionWarn),
+    (_FAILED, ActionNodeStatus.NOT_STARTED, None, PreconditionsNotMet),
+)
+
+expected_postcondition_exceptions = (
+    (_SUCCEEDED, _ACTION_SUCCEEDED, None, AssertionError),
+    (_SUCCEEDED, _ACTION_SUCCEEDED, _FAILED, PostconditionNotMet),
+    (_SUCCEEDED, _ACTION_SUCCEEDED, ConditionStatus.SKIPPED, PostconditionWarn),
+    (_SUCCEEDED, _ACTION_SUCCEEDED, ConditionStatus.TIMEOUT, PostconditionTimeout),
+    (_FAILED, _ACTION_SUCCEEDED, _SUCCEEDED, PreconditionsNotMet),
+)
+
+
+def _ids(value):
+    """Name status parameters by their member name, leaving the rest to pytest."""
+    return value.name if isinstance(value, Enum) else None
+
+
+def _raise_for(precondition_status, action_status, postcondition_status):
+    """Raise the exception processed from an action result with the given statuses."""
+    result = ActionResult(precondition_status, action_status, postcondition_status, _MSG)
+    raise process_action_result(result)
 
 
 class TestException:
     """Test exception classes."""
 
-    @pytest.mark.parametrize("result, exception", expected_precondition_exceptions)
-    def test_precondition_exceptions(self, result: ActionResult, exception: Exception):
+    @pytest.mark.parametrize(_PARAMETERS, expected_precondition_exceptions, ids=_ids)
+    def test_precondition_exceptions(
+        self, precondition_status, action_status, postcondition_status, exception: Exception
+    ):
         """Test precondition exceptions."""
         with pytest.raises(expected_exception=exception):
-            raise process_action_result(result)
+            _raise_for(precondition_status, action_status, postcondition_status)
 
-    @pytest.mark.parametrize("result, exception", expected_action_exceptions)
-    def test_action_exceptions(self, result: ActionResult, exception: Exception):
+    @pytest.mark.parametrize(_PARAMETERS, expected_action_exceptions, ids=_ids)
+    def test_action_exceptions(
+        self, precondition_status, action_status, postcondition_status, exception: Exception
+    ):
         """Test action exceptions."""
         with pytest.raises(expected_exception=exception):
-            raise process_action_result(result)
+            _raise_for(precondition_status, action_status, postcondition_status)
 
-    @pytest.mark.parametrize("result, exception", expected_postcondition_exceptions)
-    def test_postcondition_exceptions(self, result: ActionResult, exception: Exception):
+    @pytest.mark.parametrize(_PARAMETERS, expected_postcondition_exceptions, ids=_ids)
+    def test_postcondition_exceptions(
+        self, precondition_status, action_status, postcondition_status, exception: Exception
+    ):
         """Test postcondition exceptions."""
         with pytest.raises(expected_exception=exception):
-            raise process_action_result(result)
+            _raise_for(precondition_status, action_status, postcondition_status)
@@ -18,31 +18,37 @@ import unified_planning as up
 from unified_planning.plans import SequentialPlan, TimeTriggeredPlan
 from unified_planning.plans.partial_order_plan import PartialOrderPlan
 from unified_planning.shortcuts import *  # pylint: disable=unused-wildcard-import
-from unified_planning.test.examples import get_example_problems
 
+from tests import _get_example_problems
 from up_esb.components.graph import plan_to_dependency_graph
 
 # pylint: disable=all
 
 
 class TestPartialOrderPlanGeneration(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        example = _get_example_problems()["robot_fluent_of_user_type"]
+        cls.plan = example.valid_plans[-1]
+        cls.pop = cls.plan.convert_to(PlanKind.PARTIAL_ORDER_PLAN, example.problem)
+        cls.dep_graph = plan_to_dependency_graph(cls.pop)
+
     def test_partial_order_plan_to_dependency_graph(self):
-        example_problems = get_example_problems()
-        problem = example_problems["robot_fluent_of_user_type"].problem
-        plan = example_problems["robot_fluent_of_user_type"].valid_plans[-1]
-        pop = plan.convert_to(PlanKind.PARTIAL_ORDER_PLAN, problem)
-        assert isinstance(pop, PartialOrderPlan)
-        dep_graph = plan_to_dependency_graph(pop)
+        assert isinstance(self.pop, PartialOrderPlan)
 
         # Partial Orders are not ordered in the graph. Therefore, we can only check if all actions are in the graph
-        actions = [str(action) for action in plan.actions] + ["start", "end"]
-        for node in dep_graph.nodes(data=True):
-            self.assertTrue(node[1]["node_name"] in actions)
+        actions = {str(action) for action in self.plan.actions} | {"start", "end"}
+        node_names = {node["node_name"] for _, node in self.dep_graph.nodes(data=True)}
+        self.assertLessEqual(node_names, actions)
 
 
 class TestSequentialPlanTranslation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.example_problems = _get_example_problems()
+
     def test_simple_translation(self):
-        problems = get_example_problems()
+        problems = self.example_problems
 
         for test_case in problems.values():
             if not test_case.valid_plans:
@@ -92,14 +98,14 @@ class TestSequentialPlanTranslation(unittest.TestCase):
         self.assertEqual(actions, graph_actions)
         self.assertEqual(len(dep_graph.nodes()), 4)
 
-    def test_all(self):
-        self.test_simple_translation()
-        self.test_special_cases()
-
 
 class TestTimeTriggeredPlanTrasnslation(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.example_problems = _get_example_problems()
+
     def test_simple_translation(self):
-        problems = get_example_problems()
+        problems = self.example_problems
 
         for test_case in problems.values():
             if not test_case.valid_plans:
@@ -208,12 +214,6 @@ class TestTimeTriggeredPlanTrasnslation(unittest.TestCase):
         self.assertEqual(actions, graph_actions)
         self.assertEqual(len(dep_graph.nodes()), 6)
 
-    def test_all(self):
-        self.test_simple_translation()
-        self.test_special_cases()
-
 
 if __name__ == "__main__":
-    TestPartialOrderPlanGeneration().test_partial_order_plan_to_dependency_graph()
-    TestSequentialPlanTranslation().test_all()
-    TestTimeTriggeredPlanTrasnslation().test_all()
+    unittest.main()
@@ -19,22 +19,26 @@
 # - Selvakumar H S, LAAS-CNRS
 """Bridge between application and planning domains"""
 
+import ast
 import itertools
 import sys
 import typing
 from collections import OrderedDict
 from enum import Enum
-from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+from types import CodeType
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple, Union
 
 import networkx as nx
-from unified_planning.engines import OptimalityGuarantee
+from unified_planning.engines import Engine, OptimalityGuarantee
 from unified_planning.model import (
     DurativeAction,
     Fluent,
+    FNode,
     InstantaneousAction,
     Object,
     Parameter,
     Problem,
+    ProblemKind,
     Type,
 )
 from unified_planning.model.metrics import MinimizeSequentialPlanLength
@@ -51,6 +55,11 @@ from up_esb.components import ExpressionManager
 from up_esb.components.graph import plan_to_dependency_graph
 
 
+def _compile(expression: ast.Expression) -> CodeType:
+    """Compile an expression once, so it can be evaluated repeatedly during execution."""
+    return compile(expression, filename="<ast>", mode="eval")
+
+
 class Bridge:
     """Generic bridge between application and planning domains"""
 
@@ -63,6 +72,12 @@ class Bridge:
         self._api_actions: Dict[str, Callable[..., object]] = {}
         self._objects: Dict[str, Object] = {}
         self._api_objects: Dict[str, object] = {}
+        # Names and signatures per function, cleared whenever new types are created.
+        self._signatures: Dict[Callable[..., object], Tuple[str, Dict[str, type]]] = {}
+        # UP types resolved per API type, cleared whenever the types change.
+        self._resolved_types: Dict[type, Type] = {}
+        # Planner engines per request, destroyed by close().
+        self._planners: Dict[Hashable, Engine] = {}
 
         self._int_bounds: Tuple[int, int] = (0, 100)
         self._real_bounds: Tuple[float, float] = (0, 100)
@@ -83,6 +98,7 @@ class Bridge:
         self._int_bounds = bounds
         assert bounds[0] <= bounds[1], f"Invalid bounds {bounds}!"
         self._types[int] = IntType(lower_bound=bounds[0], upper_bound=bounds[1])
+        self._resolved_types.clear()
 
     @property
     def real_bounds(self) -> Tuple[float, float]:
@@ -95,6 +111,7 @@ class Bridge:
         self._real_bounds = bounds
         assert bounds[0] <= bounds[1], f"Invalid bounds {bounds}!"
         self._types[float] = RealType(lower_bound=bounds[0], upper_bound=bounds[1])
+        self._resolved_types.clear()
 
     @property
     def objects(self) -> Dict[str, Object]:
@@ -103,25 +120,36 @@ class Bridge:
 
     def create_types(self, api_types: Iterable[type]) -> None:
         """Create UP user types based on api_types."""
+        self._signatures.clear()
+        self._resolved_types.clear()
         for api_type in api_types:
             assert api_type not in self._types, f"Type {api_type} already created!"
             self._types[api_type] = UserType(api_type.__name__)
 
     def get_type(self, api_type: type) -> Type:
         """Return UP user type corresponding to api_type or its superclasses."""
-        for check_type, user_type in self._types.items():
-            if issubclass(api_type, check_type):
-                return user_type
-
-        raise ValueError(f"No corresponding UserType defined for {api_type}!")
+        user_type = self._resolve_type(api_type)
+        if user_type is None:
+            raise ValueError(f"No corresponding UserType defined for {api_type}!")
+        return user_type
 
     def get_object_type(self, api_object: object) -> Type:
         """Return UP user type corresponding to api_object's type."""
-        for api_type, user_type in self._types.items():
-            if isinstance(api_object, api_type):
-                return user_type
-
-        raise ValueError(f"No corresponding UserType defined for {api_object}!")
+        user_type = self._resolve_type(type(api_object))
+        if user_type is None:
+            raise ValueError(f"No corresponding UserType defined for {api_object}!")
+        return user_type
+
+    def _resolve_type(self, api_type: type) -> Optional[Type]:
+        """Return UP type of the first declared type api_type subclasses, if any."""
+        if api_type not in self._resolved_types:
+            for check_type, user_type in self._types.items():
+                if issubclass(api_type, check_type):
+                    self._resolved_types[api_type] = user_type
+                    break
+            else:
+                return None
+        return self._resolved_types[api_type]
 
     def get_name_and_signature(
         self, function: Callable[..., object]
@@ -131,6 +159,13 @@ class Bridge:
          corresponding UP representation exists for its defining class, implicitly return the later
          as first parameter of the signature.
         """
+        if function not in self._signatures:
+            self._signatures[function] = self._inspect_signature(function)
+        name, signature = self._signatures[function]
+        return name, OrderedDict(signature)
+
+    def _inspect_signature(self, function: Callable[..., object]) -> Tuple[str, Dict[str, type]]:
+        """Resolve name and API signature of function, see get_name_and_signature()."""
         signature: Dict[str, Type] = OrderedDict()
         if hasattr(function, "__qualname__") and "." in function.__qualname__:
             # Determine defining class of function.
@@ -291,11 +326,13 @@ class Bridge:
         self, action: ActionInstance
     ) -> Tuple[Callable[..., object], List[object]]:
         """Return API callable and parameters corresponding to the given action."""
-        if action.action.name not in self._api_actions:
+        api_action = self._api_actions.get(action.action.name)
+        if api_action is None:
             raise ValueError(f"No corresponding action defined for {action}!")
 
-        return self._api_actions[action.action.name], [
-            self._api_objects[parameter.object().name] for parameter in action.actual_parameters
+        api_objects = self._api_objects
+        return api_action, [
+            api_objects[parameter.object().name] for parameter in action.actual_parameters
         ]
 
     def create_object(self, name: str, api_object: object) -> Object:
@@ -337,15 +374,26 @@ class Bridge:
         problem.add_objects(self._objects.values() if objects is None else objects)
         return problem
 
-    def set_initial_values(self, problem: Problem) -> None:
+    def set_initial_values(
+        self, problem: Problem, values: Optional[Dict[FNode, object]] = None
+    ) -> None:
         """
         Set all initial values using the functions corresponding to this problem's fluents.
+        If values is given, set exactly these initial values instead, mapping fluent expressions
+         to their values.
 
         Note: This will update all values for all parameter combinations for each fluent.
          Its intended usage is to update the planning problem by the current system state
          with one single function call.
         """
-        type_objects: Dict[type, List[Object]] = {}
+        if values is not None:
+            for fluent_expression, value in values.items():
+                problem.set_initial_value(fluent_expression, value)
+            return
+
+        type_objects: Dict[Type, List[Object]] = {}
+        # Pairs of UP objects and their API counterparts, only resolved for API fluent functions.
+        type_object_pairs: Dict[Type, List[Tuple[Object, object]]] = {}
         # Collect objects in problem for all parameters of all fluents.
         for fluent in problem.fluents:
             for parameter in fluent.signature:
@@ -353,25 +401,64 @@ class Bridge:
                 if parameter.type not in type_objects:
                     type_objects[parameter.type] = list(problem.objects(parameter.type))
         for fluent in problem.fluents:
-            # Loop through all parameter value combinations.
-            for parameters in itertools.product(
-                *[type_objects[parameter.type] for parameter in fluent.signature]
+            function = self._fluent_functions[fluent.name]
+            if fluent.name not in self._api_function_names:
+                # Loop through all parameter value combinations.
+                for parameters in itertools.product(
+                    *[type_objects[parameter.type] for parameter in fluent.signature]
+                ):
+                    problem.set_initial_value(fluent(*parameters), function(*parameters))
+                continue
+
+            for parameter in fluent.signature:
+                if parameter.type not in type_object_pairs:
+                    type_object_pairs[parameter.type] = [
+                        (up_object, self._api_objects[up_object.name])
+                        for up_object in type_objects[parameter.type]
+                    ]
+            # Use the API fluent function to calculate the initial values.
+            for pairs in itertools.product(
+                *[type_object_pairs[parameter.type] for parameter in fluent.signature]
             ):
-                # Use the fluent function to calculate the initial values.
-                value = (
-                    self.get_object(
-                        self._fluent_functions[fluent.name](
-                            *[self._api_objects[parameter.name] for parameter in parameters]
-                        )
-                    )
-                    if fluent.name in self._api_function_names
-                    else self._fluent_functions[fluent.name](*parameters)
-                )
-                problem.set_initial_value(fluent(*parameters), value)
+                grounded = [up_object for up_object, _ in pairs]
+                value = self.get_object(function(*[api_object for _, api_object in pairs]))
+                problem.set_initial_value(fluent(*grounded), value)
+
+    def __enter__(self) -> "Bridge":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Destroy the planner engines created by solve()."""
+        for planner in self._planners.values():
+            planner.destroy()
+        self._planners.clear()
+
+    def _get_planner(
+        self,
+        name: Optional[str] = None,
+        problem_kind: Optional[ProblemKind] = None,
+        optimality_guarantee: Optional[OptimalityGuarantee] = None,
+    ) -> Engine:
+        """Return a OneshotPlanner, reusing it for repeated requests with the same arguments."""
+        if problem_kind is None:
+            problem_kind = ProblemKind()
+        key = (name, problem_kind, optimality_guarantee)
+        planner = self._planners.get(key)
+        if planner is None:
+            planner = OneshotPlanner(
+                name=name, problem_kind=problem_kind, optimality_guarantee=optimality_guarantee
+            )
+            self._planners[key] = planner
+        return planner
 
-    @staticmethod
     def solve(
-        problem: Problem, planner_name: Optional[str] = None, optimize_with_default_metric=True
+        self,
+        problem: Problem,
+        planner_name: Optional[str] = None,
+        optimize_with_default_metric=True,
     ) -> Optional[Plan]:
         """Solve planning problem and return a UP Plan, if possible."""
         if optimize_with_default_metric:
@@ -380,17 +467,17 @@ class Bridge:
                 for metric in problem.quality_metrics
             ):
                 problem.add_quality_metric(MinimizeSequentialPlanLength())
-            planner = OneshotPlanner(
+            planner = self._get_planner(
                 problem_kind=problem.kind, optimality_guarantee=OptimalityGuarantee.SOLVED_OPTIMALLY
             )
         else:
-            planner = OneshotPlanner(name=planner_name, problem_kind=problem.kind)
+            planner = self._get_planner(name=planner_name, problem_kind=problem.kind)
         return planner.solve(problem).plan
 
     def get_executable_graph(
         self, plan: Union[SequentialPlan, TimeTriggeredPlan, PartialOrderPlan]
     ) -> nx.DiGraph:
-        """Get executable graph from plan."""
+        """Get executable graph from plan. Each call builds a new graph that callers may modify."""
         executable_graph = plan_to_dependency_graph(plan)
 
         # Add elements and functions as a context for the executable graph
@@ -399,10 +486,22 @@ class Bridge:
         context.update(self._api_actions)
         context.update(self._fluent_functions)
 
-        for node in executable_graph.nodes(data=True):
-            node_id = node[0]
-            action = node[1]["action"]
-            action_parameters = node[1]["parameters"]
+        # Actions of the same kind with the same arguments share their compiled conditions.
+        exp_manager = ExpressionManager()
+        compiled_expressions: Dict[Tuple[FNode, tuple], CodeType] = {}
+
+        def convert(expression: FNode, action_parameters: Dict[str, FNode]) -> CodeType:
+            key = (expression, tuple(action_parameters.items()))
+            code = compiled_expressions.get(key)
+            if code is None:
+                code = compiled_expressions[key] = _compile(
+                    exp_manager.convert(expression, parameters=action_parameters)
+                )
+            return code
+
+        for node in executable_graph.nodes.values():
+            action = node["action"]
+            action_parameters = node["parameters"]
             if action in ["start", "end"]:
                 continue  # TODO: Handle start and end nodes.
             if action not in self._api_actions:
@@ -414,44 +513,29 @@ class Bridge:
                 actual_param = str(actual_param)
                 if actual_param not in self._api_objects:
                     raise ValueError(f"Object {actual_param} not defined in API!")
-                parameters[param] = self._api_objects[str(actual_param)]
-            executable_graph.nodes[node_id]["parameters"] = parameters
-
-            exp_manager = ExpressionManager()
+                parameters[param] = self._api_objects[actual_param]
+            node["parameters"] = parameters
 
             # Action Preconditions
-            executable_preconditions: Dict[str, List[Callable]] = {}
-            for interval, preconditions in executable_graph.nodes[node_id]["preconditions"].items():
-                # Interval is start for instantaneous actions, and (start, end) for timed actions.
-                executable_preconditions[interval] = (
-                    []
-                    if interval not in executable_preconditions
-                    else executable_preconditions[interval]
-                )
-
-                for precondition in preconditions:
-                    executable_preconditions[interval].append(
-                        exp_manager.convert(precondition, parameters=action_parameters)
-                    )
-            executable_graph.nodes[node_id]["preconditions"] = executable_preconditions
+            # Interval is start for instantaneous actions, and (start, end) for timed actions.
+            node["preconditions"] = {
+                interval: [convert(condition, action_parameters) for condition in preconditions]
+                for interval, preconditions in node["preconditions"].items()
+            }
 
             # Action Effects
-            executable_effects: Dict[str, List[Tuple[Callable, typing.Any]]] = {}
-            for interval, effects in executable_graph.nodes[node_id]["postconditions"].items():
-                executable_effects[interval] = (
-                    [] if interval not in executable_effects else executable_effects[interval]
-                )
-
-                for effect in effects:
-                    executable_effects[interval].append(
-                        (
-                            exp_manager.convert(effect.fluent, parameters=action_parameters),
-                            exp_manager.convert(effect.value, parameters=action_parameters),
-                        )
+            node["postconditions"] = {
+                interval: [
+                    (
+                        convert(effect.fluent, action_parameters),
+                        convert(effect.value, action_parameters),
                     )
-            executable_graph.nodes[node_id]["postconditions"] = executable_effects
+                    for effect in effects
+                ]
+                for interval, effects in node["postconditions"].items()
+            }
 
             # Finally setup execution context to the nodes
-            executable_graph.nodes[node_id]["context"] = context
+            node["context"] = context
 
         return executable_graph
@@ -14,6 +14,7 @@
 
 """Convert the unified planning FNode expression to an AST tree."""
 import ast
+from typing import Dict, Tuple
 
 from unified_planning.shortcuts import FNode, get_environment
 
@@ -25,11 +26,15 @@ class ExpressionManager:
         self._expression = None
         self._options = None
         self._manager = get_environment().expression_manager
+        # Converted subtrees, keyed on the expression and the parameters they were grounded with.
+        self._cache: Dict[Tuple[FNode, tuple], ast.AST] = {}
+        self._parameters_key: tuple = ()
 
     def convert(self, expression: FNode, **options):
         """Walk the tree."""
         self._expression = expression
         self._options = options
+        self._parameters_key = tuple((options.get("parameters") or {}).items())
         tree = self._create_tree(expression)
         return tree
 
@@ -43,6 +48,13 @@ class ExpressionManager:
         raise ValueError(f"Unable to parse expression {expression}")
 
     def _map_expression(self, expression: FNode):
+        key = (expression, self._parameters_key)
+        ast_expression = self._cache.get(key)
+        if ast_expression is None:
+            ast_expression = self._cache[key] = self._build_expression(expression)
+        return ast_expression
+
+    def _build_expression(self, expression: FNode):
         expression = self._manager.auto_promote(expression)
 
         for exp in expression:
@@ -44,12 +44,12 @@ def plan_to_dependency_graph(
 
 def _partial_order_plan_to_dependency_graph(plan: PartialOrderPlan) -> nx.DiGraph:
     """Convert UP Partial Order Plan to Dependency Graph."""
-    dependency_graph = nx.DiGraph()
+    adjacency_list = plan.get_adjacency_list
 
     # Prepare Node IDs
     nodes = set()
     node_map = {}
-    for action, successors in plan.get_adjacency_list.items():
+    for action, successors in adjacency_list.items():
         nodes.add(action)
         for succ in successors:
             nodes.add(succ)
@@ -59,82 +59,85 @@ def _partial_order_plan_to_dependency_graph(plan: PartialOrderPlan) -> nx.DiGrap
     for i, node in enumerate(nodes):
         node_map[node] = i
 
-    dependency_graph.add_node(
-        node_map["end"],
-        node_name="end",
-        action="end",
-        parameters={},
-        preconditions={},
-        postconditions={},
-    )
-    for action, successors in plan.get_adjacency_list.items():
+    # Collect all nodes and edges first and add them to the graph at once.
+    graph_nodes = [(node_map["end"], _terminal_node_attributes("end"))]
+    edges = []
+    has_predecessor = set()
+    for action, successors in adjacency_list.items():
         parameters, preconditions, postconditions = _process_action(action)
 
-        dependency_graph.add_node(
-            node_map[action],
-            node_name=str(action),
-            action=action.action.name,
-            parameters=parameters,
-            preconditions=preconditions,
-            postconditions=postconditions,
+        graph_nodes.append(
+            (
+                node_map[action],
+                {
+                    "node_name": str(action),
+                    "action": action.action.name,
+                    "parameters": parameters,
+                    "preconditions": preconditions,
+                    "postconditions": postconditions,
+                },
+            )
         )
         # add edges to successors
         for succ in successors:
-            dependency_graph.add_edge(node_map[action], node_map[succ])
+            edges.append((node_map[action], node_map[succ]))
+            has_predecessor.add(node_map[succ])
         # add end node and edges from nodes without successors
         if len(successors) == 0:
-            dependency_graph.add_edge(node_map[action], node_map["end"])
+            edges.append((node_map[action], node_map["end"]))
+            has_predecessor.add(node_map["end"])
 
     # add start node and edges to nodes without predecessors
-    start_nodes = [node for node, in_degree in dependency_graph.in_degree() if in_degree == 0]
-    dependency_graph.add_node(
-        node_map["start"],
-        node_name="start",
-        action="start",
-        parameters={},
-        preconditions={},
-        postconditions={},
+    graph_nodes.append((node_map["start"], _terminal_node_attributes("start")))
+    edges.extend(
+        (node_map["start"], node_id)
+        for node_id, _ in graph_nodes[:-1]
+        if node_id not in has_predecessor
     )
-    for node in start_nodes:
-        dependency_graph.add_edge(node_map["start"], node)
 
+    dependency_graph = nx.DiGraph()
+    dependency_graph.add_nodes_from(graph_nodes)
+    dependency_graph.add_edges_from(edges)
     return dependency_graph
 
 
 def _sequential_plan_to_dependency_graph(plan: SequentialPlan) -> nx.DiGraph:
     """Convert UP Sequential Plan to Dependency Graph."""
-    dependency_graph = nx.DiGraph()
-    parent_id = 0
-    dependency_graph.add_node(
-        parent_id,
-        node_name="start",
-        action="start",
-        parameters={},
-        preconditions={},
-        postconditions={},
-    )
+    nodes = [(0, _terminal_node_attributes("start"))]
     for i, action in enumerate(plan.actions):
         parameters, preconditions, postconditions = _process_action(action)
-        child_id = i + 1
-        dependency_graph.add_node(
-            child_id,
-            node_name=str(action),
-            action=action.action.name,
-            parameters=parameters,
-            preconditions=preconditions,
-            postconditions=postconditions,
+        nodes.append(
+            (
+                i + 1,
+                {
+                    "node_name": str(action),
+                    "action": action.action.name,
+                    "parameters": parameters,
+                    "preconditions": preconditions,
+                    "postconditions": postconditions,
+                },
+            )
         )
-        dependency_graph.add_edge(parent_id, child_id)
-        parent_id = child_id
+    nodes.append((len(nodes), _terminal_node_attributes("end")))
 
-    child_id = parent_id + 1  # End node
-    dependency_graph.add_node(
-        child_id, node_name="end", action="end", parameters={}, preconditions={}, postconditions={}
-    )
-    dependency_graph.add_edge(parent_id, child_id)
+    # Chain all nodes in plan order
+    dependency_graph = nx.DiGraph()
+    dependency_graph.add_nodes_from(nodes)
+    dependency_graph.add_edges_from((i, i + 1) for i in range(len(nodes) - 1))
     return dependency_graph
 
 
+def _terminal_node_attributes(name: str) -> dict:
+    """Return the attributes of the start or end node."""
+    return {
+        "node_name": name,
+        "action": name,
+        "parameters": {},
+        "preconditions": {},
+        "postconditions": {},
+    }
+
+
 def _time_triggered_plan_to_dependency_graph(plan: TimeTriggeredPlan) -> nx.DiGraph:
     """Convert UP Time Triggered Plan to Dependency Graph."""
     dependency_graph = nx.DiGraph()
@@ -80,39 +80,41 @@ class ActionWarn(Warning):
     """Raised when an action is not executed"""
 
 
+# Exceptions per unsuccessful status of each execution phase.
+_PRECONDITION_EXCEPTIONS = {
+    ConditionStatus.FAILED: PreconditionsNotMet,
+    ConditionStatus.SKIPPED: PreconditionWarn,
+    ConditionStatus.NOT_STARTED: PreconditionError,
+    ConditionStatus.TIMEOUT: PreconditionsTimeout,
+}
+_ACTION_EXCEPTIONS = {
+    ActionNodeStatus.FAILED: ActionNotFinished,
+    ActionNodeStatus.SKIPPED: ActionWarn,
+    ActionNodeStatus.NOT_STARTED: ActionNotExecuted,
+    ActionNodeStatus.TIMEOUT: ActionTimeout,
+}
+_POSTCONDITION_EXCEPTIONS = {
+    ConditionStatus.FAILED: PostconditionNotMet,
+    ConditionStatus.SKIPPED: PostconditionWarn,
+    ConditionStatus.NOT_STARTED: PostconditionError,
+    ConditionStatus.TIMEOUT: PostconditionTimeout,
+}
+
+
 def process_action_result(result: ActionResult) -> Exception:
     """Process the result of an action."""
-    if result.precondition_status == ConditionStatus.FAILED:
-        return PreconditionsNotMet(result.result)
-    elif result.precondition_status == ConditionStatus.SKIPPED:
-        return PreconditionWarn(result.result)
-    elif result.precondition_status == ConditionStatus.NOT_STARTED:
-        return PreconditionError(result.result)
-    elif result.precondition_status == ConditionStatus.TIMEOUT:
-        return PreconditionsTimeout(result.result)
+    exception = _PRECONDITION_EXCEPTIONS.get(result.precondition_status)
+    if exception is not None:
+        return exception(result.result)
 
     assert result.precondition_status == ConditionStatus.SUCCEEDED
     assert result.action_status is not None
 
-    if result.action_status == ActionNodeStatus.FAILED:
-        return ActionNotFinished(result.result)
-    elif result.action_status == ActionNodeStatus.SKIPPED:
-        return ActionWarn(result.result)
-    elif result.action_status == ActionNodeStatus.NOT_STARTED:
-        return ActionNotExecuted(result.result)
-    elif result.action_status == ActionNodeStatus.TIMEOUT:
-        return ActionTimeout(result.result)
+    exception = _ACTION_EXCEPTIONS.get(result.action_status)
+    if exception is not None:
+        return exception(result.result)
 
     assert result.action_status == ActionNodeStatus.SUCCEEDED
     assert result.postcondition_status is not None
 
-    if result.postcondition_status == ConditionStatus.FAILED:
-        return PostconditionNotMet(result.result)
-    if result.postcondition_status == ConditionStatus.SKIPPED:
-        return PostconditionWarn(result.result)
-    if result.postcondition_status == ConditionStatus.NOT_STARTED:
-        return PostconditionError(result.result)
-    if result.postcondition_status == ConditionStatus.TIMEOUT:
-        return PostconditionTimeout(result.result)
-
-    return UPESBException(result.result)
+    return _POSTCONDITION_EXCEPTIONS.get(result.postcondition_status, UPESBException)(result.result)
@@ -164,12 +164,7 @@ class InstantaneousTaskExecutor(ActionExecutor):
         conditions = self._dependency_graph.nodes[task_id]["preconditions"]["start"]
 
         for i, condition in enumerate(conditions):
-            result = (
-                eval(  # pylint: disable=eval-used
-                    compile(condition, filename="<ast>", mode="eval"), self._context
-                )
-                or self._dry_run
-            )
+            result = eval(condition, self._context) or self._dry_run  # pylint: disable=eval-used
 
             # Check if all preconditions return boolean True
             if not result and not self._dry_run:
@@ -188,12 +183,8 @@ class InstantaneousTaskExecutor(ActionExecutor):
 
         for i, (_, conditions) in enumerate(post_conditions.items()):
             for condition, value in conditions:
-                actual = eval(  # pylint: disable=eval-used
-                    compile(condition, filename="<ast>", mode="eval"), self._context
-                )
-                expected = eval(  # pylint: disable=eval-used
-                    compile(value, filename="<ast>", mode="eval"), self._context
-                )
+                actual = eval(condition, self._context)  # pylint: disable=eval-used
+                expected = eval(value, self._context)  # pylint: disable=eval-used
 
                 if actual != expected and not self._dry_run:
                     return RuntimeError(
@@ -305,19 +296,13 @@ class TemporalTaskExecutor(ActionExecutor):
         return ConditionStatus.SUCCEEDED
 
     def _check_precondition(self, condition):
-        result = eval(  # pylint: disable=eval-used
-            compile(condition, filename="<ast>", mode="eval"), self._context
-        )
+        result = eval(condition, self._context)  # pylint: disable=eval-used
 
         return result
 
     def _check_postcondition(self, condition, value):
         """Check postconditions of the given task."""
-        actual = eval(  # pylint: disable=eval-used
-            compile(condition, filename="<ast>", mode="eval"), self._context
-        )
-        expected = eval(  # pylint: disable=eval-used
-            compile(value, filename="<ast>", mode="eval"), self._context
-        )
+        actual = eval(condition, self._context)  # pylint: disable=eval-used
+        expected = eval(value, self._context)  # pylint: disable=eval-used
 
         return actual == expected
@@ -12,57 +12,64 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Simple executor for UP Bridge. Currently no await is supported."""
+"""Simple executor for UP Bridge, running independent actions in parallel."""
 
 import asyncio
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Hashable
 
 import networkx as nx
 
 
 # TODO: Move to dispatcher
 class Executor:
-    """Add simple executor for UP Bridge. Currently no await is supported.
+    """Add simple executor for UP Bridge.
 
     - Handles sequential, time-triggered and parallel actions
+    - Actions of the same topological generation do not depend on each other. Their coroutine
+      functions run concurrently on one event loop shared by the whole execution, while other
+      callables run on a pool of max_workers threads.
+    - With the default of one worker, callables run one at a time. Only set max_workers higher
+      if the actions are thread-safe, e.g. do not modify shared application state unguarded.
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, max_workers: int = 1):
+        self._max_workers = max_workers
 
-    def execute(self, graph: nx.DiGraph):
-        """Execute the graph."""
-        result = None
-        for node in graph.nodes(data=True):
-            if node[1]["node_name"] in ["start", "end"]:
-                continue
-            successors = list(graph.successors(node[0]))
-            if len(successors) > 1:
-                # Assume all successors are parallel actions
+    def execute(self, graph: nx.DiGraph) -> Dict[Hashable, object]:
+        """Execute the graph layer by layer and return the result of each action by node id."""
+        return asyncio.run(self._execute_graph(graph))
 
-                # Fetch complete node data
-                for s in successors:
-                    successors[successors.index(s)] = (s, graph.nodes[s])
-                self._execute_coroutines(successors)
-            else:
-                parameters = node[1]["parameters"]
-                executor = node[1]["context"][node[1]["action"]]
-                result = executor(**parameters)
+    async def _execute_graph(self, graph: nx.DiGraph) -> Dict[Hashable, object]:
+        results: Dict[Hashable, object] = {}
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            # Each generation only depends on previous ones, so its actions can run concurrently.
+            for layer in nx.topological_generations(graph):
+                node_ids = [
+                    node_id
+                    for node_id in layer
+                    if graph.nodes[node_id]["node_name"] not in ["start", "end"]
+                ]
+                layer_results = await asyncio.gather(
+                    *(self._execute_action(pool, graph.nodes[node_id]) for node_id in node_ids)
+                )
+                results.update(zip(node_ids, layer_results))
 
-        return result
+        return results
 
-    async def _execute_concurrent_action(self, action):
-        # TODO: Better implementation
-        # FIXME: Duplicate execution of actions
-        parameters = action[1]["parameters"]
-        executor = action[1]["context"][action[1]["action"]]
-        result = executor(**parameters)
+    @staticmethod
+    async def _execute_action(pool: ThreadPoolExecutor, node: dict):
+        parameters = node["parameters"]
+        executor = node["context"][node["action"]]
+        if inspect.iscoroutinefunction(executor):
+            return await executor(**parameters)
 
+        result = await asyncio.get_running_loop().run_in_executor(
+            pool, partial(executor, **parameters)
+        )
+        # Callables may still hand back an awaitable, which runs on the shared loop as well.
+        if inspect.isawaitable(result):
+            result = await result
         return result
-
-    async def _run_concurrent_tasks(self, tasks):
-        # TODO: add await on parallel actions
-        await asyncio.gather(*tasks)
-
-    def _execute_coroutines(self, actions):
-        tasks = [self._execute_concurrent_action(a) for a in actions]
-        asyncio.run(self._run_concurrent_tasks(tasks))
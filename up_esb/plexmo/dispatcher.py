@@ -18,6 +18,8 @@
 # - Marc Vinci, DFKI
 # - Selvakumar H S, LAAS-CNRS
 """Dispatcher for executing plans."""
+from collections import deque
+
 import networkx as nx
 from unified_planning.plans import Plan
 
@@ -80,7 +82,7 @@ class PlanDispatcher:
 
         while self._status != DispatcherStatus.REPLANNING or not self._node_data:
             # Get the next node to be executed
-            node_id, node = self._node_data.pop(0) if len(self._node_data) > 0 else (None, None)
+            node_id, node = self._node_data.popleft() if self._node_data else (None, None)
             if node_id is None:
                 break
             if self._status == DispatcherStatus.REPLANNING:
@@ -89,7 +91,8 @@ class PlanDispatcher:
 
             self._monitor.status = MonitorStatus.IN_PROGRESS
 
-            predecessors = list(self.monitor_graph.predecessors(node_id))
+            # The monitor already stores the predecessors of every node.
+            predecessors = self.monitor_graph.nodes[node_id]["predecessors"]
 
             # Start and end nodes
             if node["action"] == "start":
@@ -176,7 +179,10 @@ class PlanDispatcher:
         self._monitor = PlanMonitor(graph)
         self._monitor.status = MonitorStatus.STARTED
 
-        self._node_data = [(node_id, node) for node_id, node in graph.nodes(data=True)]
+        # Dispatch in topological order, so every action comes after all of its predecessors.
+        self._node_data = deque(
+            (node_id, graph.nodes[node_id]) for node_id in nx.topological_sort(graph)
+        )
 
     def set_dispatch_callback(self, callback):
         """Set callback function for executing actions.
@@ -52,6 +52,7 @@ class PlanMonitor:
         """Preprocess graph to remove the executable elements."""
 
         new_graph = nx.DiGraph()
+        pred, succ = self._graph.pred, self._graph.succ
 
         for node_id, node in self._graph.nodes(data=True):
             # Add the node.
@@ -66,8 +67,8 @@ class PlanMonitor:
             new_graph.add_edges_from(self._graph.edges(node_id))
 
             # Predecessors and successors.
-            new_graph.nodes[node_id]["predecessors"] = list(self._graph.predecessors(node_id))
-            new_graph.nodes[node_id]["successors"] = list(self._graph.successors(node_id))
+            new_graph.nodes[node_id]["predecessors"] = list(pred[node_id])
+            new_graph.nodes[node_id]["successors"] = list(succ[node_id])
 
         self._graph = new_graph
 